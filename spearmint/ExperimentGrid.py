@@ -21,14 +21,12 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
 import sys
-import tempfile
-import cPickle
 
 import numpy        as np
 import numpy.random as npr
 
-from sobol_lib     import *
 from helpers       import *
+from gridstore     import *
 
 import logging
 
@@ -38,9 +36,84 @@ RUNNING_STATE   = 2
 COMPLETE_STATE  = 3
 BROKEN_STATE    = -1
 
-EXPERIMENT_GRID_FILE = 'expt-grid.pkl'
-
-class ExperimentGrid:
+# The index sets kept by the grid, and the one each state belongs to.
+STATE_SETS = { CANDIDATE_STATE : 'candidates',
+               SUBMITTED_STATE : 'pending',
+               RUNNING_STATE   : 'pending',
+               COMPLETE_STATE  : 'complete',
+               BROKEN_STATE    : 'broken' }
+
+class GridColumn(object):
+    """
+    A column of the grid.  Columns are views of the first num_jobs rows of
+    buffers that grow by doubling, so that add_to_grid does not copy the
+    whole grid every time a point is added.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, expt_grid, owner):
+        if expt_grid is None:
+            return self
+        return expt_grid.buffers[self.name][:expt_grid.num_jobs]
+
+    def __set__(self, expt_grid, buffer):
+        expt_grid.buffers[self.name] = buffer
+
+class StreamGrid(object):
+    """
+    The grid as the choosers see it when its Sobol points are streamed.
+    The first rows are the jobs in the grid, and row num_jobs + i is
+    point i of the Sobol sequence, which is only generated when looked up.
+    Points appended with append() come after the whole sequence.
+    """
+
+    def __init__(self, expt_grid, extra=None):
+        self.expt_grid = expt_grid
+        self.grid      = expt_grid.grid
+        self.stream    = self.grid.shape[0] + expt_grid.stream_size
+        self.extra     = np.zeros((0, self.grid.shape[1]))
+        if extra is not None:
+            self.extra = extra
+        self.shape     = (self.stream + self.extra.shape[0],
+                          self.grid.shape[1])
+        self.ndim      = 2
+        self.dtype     = self.grid.dtype
+
+    def __len__(self):
+        return self.shape[0]
+
+    def append(self, points):
+        """The grid with points as its last rows, leaving this one be."""
+        return StreamGrid(self.expt_grid,
+                          np.vstack((self.extra, np.atleast_2d(points))))
+
+    def __getitem__(self, key):
+        cols = slice(None)
+        if isinstance(key, tuple):
+            key, cols = key
+        if isinstance(key, slice):
+            key = np.arange(*key.indices(self.shape[0]))
+
+        rows   = np.atleast_1d(np.asarray(key))
+        stored = rows < self.grid.shape[0]
+        extra  = rows >= self.stream
+        sobol  = ~(stored | extra)
+        points = np.empty((rows.shape[0], self.shape[1]))
+        points[stored] = self.grid[rows[stored]]
+        points[extra]  = self.extra[rows[extra] - self.stream]
+        points[sobol]  = self.expt_grid.sobol_points(rows[sobol] -
+                                                     self.grid.shape[0])
+
+        points = points[:,cols]
+        if np.ndim(key) == 0:
+            return points[0]
+        return points
+
+class ExperimentGrid(object):
+
+    grid = GridColumn('grid')
 
     @staticmethod
     def job_running(expt_dir, id):
@@ -59,134 +132,233 @@ class ExperimentGrid:
         expt_grid = ExperimentGrid(expt_dir)
         expt_grid.set_broken(id)
 
-    def __init__(self, expt_dir, variables=None, grid_size=None, grid_seed=1):
+    def __init__(self, expt_dir, variables=None, grid_size=None, grid_seed=1,
+                 store=None, stream=False):
         self.expt_dir = expt_dir
-        self.jobs_pkl = os.path.join(expt_dir, EXPERIMENT_GRID_FILE)
-
+        self.store    = open_grid_store(expt_dir, store)
+        self.buffers  = {}
+        self.seed     = grid_seed
+
+        # When streaming, the grid_size Sobol points are not generated up
+        # front; each one joins the grid when it is chosen.  The same size
+        # and seed have to be given every time the grid is opened.
+        self.stream_size = 0
+        if stream:
+            self.stream_size = grid_size
+            grid_size = 0
 
         # Set up the grid for the first time if it doesn't exist.
-        if variables is not None and not os.path.exists(self.jobs_pkl):
-            self.seed     = grid_seed
+        if variables is not None and not self.store.exists():
+            self.num_jobs = grid_size
             self.vmap     = GridMap(variables, grid_size)
             self.grid     = self._hypercube_grid(self.vmap.card(), grid_size)
             self.status   = np.zeros(grid_size, dtype=int) + CANDIDATE_STATE
             self.values   = np.zeros(grid_size) + np.nan
             self.durs     = np.zeros(grid_size) + np.nan
             self.proc_ids = np.zeros(grid_size, dtype=int)
+            self.cpu_times = np.zeros(grid_size) + np.nan
+            self.peak_rss  = np.zeros(grid_size) + np.nan
+            self.sobol_ids = np.arange(grid_size)
             self._save_jobs()
 
-        # Or load in the grid from the pickled file.
+        # Or load in the grid from the store.
         else:
             self._load_jobs()
 
+        self._index_jobs()
+        self._index_stream()
+
 
     def __del__(self):
-        self._save_jobs()
+        self.store.close(self)
 
     def get_grid(self):
+        if self.stream_size > 0:
+            return StreamGrid(self), self.values, self.durs
         return self.grid, self.values, self.durs
 
     def get_candidates(self):
-        return np.nonzero(self.status == CANDIDATE_STATE)[0]
+        if self.stream_size > 0:
+            # Sobol points that are not in the grid yet come after it.
+            ids = np.concatenate((self.index['candidates'],
+                                  self.num_jobs + np.flatnonzero(self.stream_free)))
+            ids.flags.writeable = False
+            return ids
+        return self.index['candidates']
 
     def get_pending(self):
-        return np.nonzero((self.status == SUBMITTED_STATE) | (self.status == RUNNING_STATE))[0]
+        return self.index['pending']
 
     def get_complete(self):
-        return np.nonzero(self.status == COMPLETE_STATE)[0]
+        return self.index['complete']
 
     def get_broken(self):
-        return np.nonzero(self.status == BROKEN_STATE)[0]
+        return self.index['broken']
 
     def get_params(self, index):
         return self.vmap.get_params(self.grid[index,:])
 
     def get_best(self):
-        finite = self.values[np.isfinite(self.values)]
-        if len(finite) > 0:
-            cur_min = np.min(finite)
-            index   = np.nonzero(self.values==cur_min)[0][0]
-            return cur_min, index
-        else:
-            return np.nan, -1
+        return self.best
 
     def get_proc_id(self, id):
         return self.proc_ids[id]
 
-    def add_to_grid(self, candidate):
+    def add_candidate(self, id):
+        '''
+        Returns the job id of candidate id, as given by get_candidates,
+        adding it to the grid first if it is a streamed Sobol point.
+        '''
+        return self.add_candidates([id])[0]
+
+    def add_candidates(self, ids):
+        '''
+        Returns the job ids of candidates ids, all as given by the same
+        call to get_candidates, adding the streamed Sobol points among
+        them to the grid.  Their ids count from the end of the grid as it
+        was before any of them were added.
+        '''
+        num_jobs = self.num_jobs
+        job_ids  = []
+        for id in ids:
+            if id < num_jobs:
+                job_ids.append(id)
+            else:
+                sobol_id = id - num_jobs
+                job_ids.append(self.add_to_grid(
+                    self.sobol_points([sobol_id])[0], sobol_id))
+        return job_ids
+
+    def sobol_points(self, sobol_ids):
+        # Point i is element seed + i - 1 of the sequence.  sobol_lib is
+        # only needed to make points, so opening a grid does not import it.
+        from sobol_lib import i4_sobol_points
+        seeds = self.seed + np.asarray(sobol_ids, dtype=np.int64) - 1
+        return np.transpose(i4_sobol_points(self.vmap.card(), seeds))
+
+    def add_to_grid(self, candidate, sobol_id=-1):
         # Checks to prevent numerical over/underflow from corrupting the grid
         candidate[candidate > 1.0] = 1.0
         candidate[candidate < 0.0] = 0.0
 
-        # Set up the grid
-        self.grid   = np.vstack((self.grid, candidate))
-        self.status = np.append(self.status, np.zeros(1, dtype=int) +
-                                int(CANDIDATE_STATE))
+        # Make room for it, doubling the buffers when they are full.
+        id = self.num_jobs
+        if id == self.buffers['grid'].shape[0]:
+            self.buffers.update(self.store.grow(self, max(2*id, 1)))
 
-        self.values = np.append(self.values, np.zeros(1)+np.nan)
-        self.durs   = np.append(self.durs, np.zeros(1)+np.nan)
-        self.proc_ids = np.append(self.proc_ids, np.zeros(1,dtype=int))
+        # Set up the grid
+        self.buffers['grid'][id,:] = candidate
+        for name, dtype, fill in JOB_COLUMNS:
+            self.buffers[name][id] = fill
+        self.buffers['sobol_ids'][id] = sobol_id
+        self.num_jobs += 1
+        if 0 <= sobol_id < self.stream_size:
+            self.stream_free[sobol_id] = False
 
         # Save this out.
-        self._save_jobs()
-        return self.grid.shape[0]-1
+        self.store.add_job(self, id)
+        self._set_index('candidates', np.append(self.index['candidates'], id))
+        return id
 
     def set_candidate(self, id):
-        self.status[id] = CANDIDATE_STATE
-        self._save_jobs()
+        self._set_status(id, CANDIDATE_STATE)
+        self._save_job(id)
 
     def set_submitted(self, id, proc_id):
-        self.status[id] = SUBMITTED_STATE
+        self._set_status(id, SUBMITTED_STATE)
         self.proc_ids[id] = proc_id
-        self._save_jobs()
+        self._save_job(id)
 
     def set_running(self, id):
-        self.status[id] = RUNNING_STATE
-        self._save_jobs()
+        self._set_status(id, RUNNING_STATE)
+        self._save_job(id)
 
-    def set_complete(self, id, value, duration):
-        self.status[id] = COMPLETE_STATE
+    def set_complete(self, id, value, duration, cpu_time=np.nan,
+                     peak_rss=np.nan):
+        self._set_status(id, COMPLETE_STATE)
         self.values[id] = value
         self.durs[id]   = duration
-        self._save_jobs()
+        self.cpu_times[id] = cpu_time
+        self.peak_rss[id]  = peak_rss
+        self._save_job(id)
+        self._update_best(id, value)
 
     def set_broken(self, id):
-        self.status[id] = BROKEN_STATE
-        self._save_jobs()
+        self._set_status(id, BROKEN_STATE)
+        self._save_job(id)
+
+    def _index_jobs(self):
+        # Build the index sets and find the best job once; from here on
+        # the set_* methods keep them up to date.
+        self.index = {}
+        for name in set(STATE_SETS.values()):
+            states = [s for s in STATE_SETS if STATE_SETS[s] == name]
+            self._set_index(name, self.store.job_ids(self, states))
+        self.best = self.store.best_job(self)
+
+    def _index_stream(self):
+        # The streamed Sobol points that are not in the grid yet.
+        self.stream_free = np.ones(self.stream_size, dtype=bool)
+        used = self.sobol_ids[(self.sobol_ids >= 0) &
+                              (self.sobol_ids < self.stream_size)]
+        self.stream_free[used] = False
+
+    def _set_index(self, name, ids):
+        # Callers get these arrays directly, so keep them from being
+        # modified behind our back.
+        ids.flags.writeable = False
+        self.index[name] = ids
+
+    def _set_status(self, id, state):
+        old = STATE_SETS[self.status[id]]
+        new = STATE_SETS[state]
+        self.status[id] = state
+
+        # The index sets are sorted, which keeps candidates in grid order.
+        if old != new:
+            ids = self.index[old]
+            pos = np.searchsorted(ids, id)
+            if pos < ids.shape[0] and ids[pos] == id:
+                self._set_index(old, np.delete(ids, pos))
+
+            ids = self.index[new]
+            self._set_index(new, np.insert(ids, np.searchsorted(ids, id), id))
+
+    def _update_best(self, id, value):
+        best_val, best_job = self.best
+        if id == best_job and not value <= best_val:
+            # The best job got worse, so look for the new best.
+            self.best = self.store.best_job(self)
+        elif np.isfinite(value) and (best_job < 0 or value < best_val or
+                                     (value == best_val and id < best_job)):
+            self.best = (value, id)
 
     def _load_jobs(self):
-        fh   = open(self.jobs_pkl, 'r')
-        jobs = cPickle.load(fh)
-        fh.close()
+        jobs = self.store.load()
 
+        self.num_jobs = jobs['grid'].shape[0]
         self.vmap   = jobs['vmap']
         self.grid   = jobs['grid']
         self.status = jobs['status']
         self.values = jobs['values']
         self.durs   = jobs['durs']
         self.proc_ids = jobs['proc_ids']
+        self.cpu_times = jobs['cpu_times']
+        self.peak_rss  = jobs['peak_rss']
+        self.sobol_ids = jobs['sobol_ids']
 
     def _save_jobs(self):
+        self.store.save(self)
 
-        # Write everything to a temporary file first.
-        fh = tempfile.NamedTemporaryFile(mode='w', delete=False)
-        cPickle.dump({ 'vmap'   : self.vmap,
-                       'grid'   : self.grid,
-                       'status' : self.status,
-                       'values' : self.values,
-                       'durs'   : self.durs,
-                       'proc_ids' : self.proc_ids }, fh, protocol=-1)
-        fh.close()
-
-        # Use an atomic move for better NFS happiness.
-        cmd = 'mv "%s" "%s"' % (fh.name, self.jobs_pkl)
-        os.system(cmd) # TODO: Should check system-dependent return status.
+    def _save_job(self, id):
+        self.store.save_job(self, id)
 
     def _hypercube_grid(self, dims, size):
         # Generate from a sobol sequence
-        sobol_grid = np.transpose(i4_sobol_generate(dims,size,self.seed))
+        return self.sobol_points(np.arange(size))
 
-        return sobol_grid
+for name, dtype, fill in JOB_COLUMNS:
+    setattr(ExperimentGrid, name, GridColumn(name))
 
 class GridMap():
 
@@ -20,9 +20,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
+import collections
 from spearmint import gp
 import sys
 from spearmint import util
+from spearmint import multistart
 import tempfile
 import numpy          as np
 import math
@@ -32,19 +34,15 @@ import scipy.stats    as sps
 import scipy.optimize as spo
 import cPickle
 import matplotlib.pyplot as plt
-import multiprocessing
-import copy
 
 from helpers import *
 
 import logging
 
 # Wrapper function to pass to parallel ei optimization calls
-def optimize_pt(c, b, comp, pend, vals, labels, model):
-    ret = spo.fmin_l_bfgs_b(model.grad_optimize_ei_over_hypers,
-                            c.flatten(), args=(comp, pend, vals, labels),
-                            bounds=b, disp=0)
-    return ret[0]
+def optimize_pt(item, b, comp, pend, vals, labels, model):
+    return multistart.local_search(model.grad_optimize_ei_over_hypers,
+                                   b, (comp, pend, vals, labels), **item)
 
 def init(expt_dir, arg_string):
     args = util.unpack_args(arg_string)
@@ -64,7 +62,7 @@ class GPConstrainedEIChooser:
     def __init__(self, expt_dir, covar="Matern52", mcmc_iters=20,
                  pending_samples=100, noiseless=False, burnin=100,
                  grid_subset=20, constraint_violating_value=np.inf,
-                 verbosity=0, visualize2D=False):
+                 verbosity=0, visualize2D=False, chunk_size=10000):
         self.cov_func        = getattr(gp, covar)
         self.state_pkl       = os.path.join(expt_dir, self.__module__ + ".pkl")
 
@@ -73,13 +71,23 @@ class GPConstrainedEIChooser:
         self.mcmc_iters      = int(mcmc_iters)
         self.burnin          = int(burnin)
         self.needs_burnin    = True
-        self.pending_samples = pending_samples
+        self.pending_samples = int(pending_samples)
         self.D               = -1
         self.hyper_iters     = 1
         # Number of points to optimize EI over
         self.grid_subset     = int(grid_subset)
+        # Number of candidates scored at a time
+        self.chunk_size      = int(chunk_size)
         self.noiseless       = bool(int(noiseless))
         self.hyper_samples   = []
+        self.posteriors      = None
+        # Kernel matrices of comp for recent length scales
+        self.kernels         = gp.KernelCache()
+        # Workers for optimizing the candidates, kept from one job to the next
+        self.pool            = util.WorkerPool()
+        # Slice samplers, with their step sizes, for each block of
+        # hyperparameters
+        self.samplers        = collections.defaultdict(util.SliceSampler)
         self.constraint_hyper_samples = []
         self.ff              = None
         self.ff_samples      = []
@@ -96,6 +104,14 @@ class GPConstrainedEIChooser:
         self.bad_value = float(constraint_violating_value)
         self.visualize2D            = visualize2D
 
+    # Start the workers for the candidates before the caller starts
+    # threads or opens files that they should not inherit.
+    def start(self):
+        self.pool.start()
+
+    def close(self):
+        self.pool.close()
+
     # A simple function to dump out hyperparameters to allow for a hot start
     # if the optimization is restarted.
     def dump_hypers(self):
@@ -202,9 +218,9 @@ class GPConstrainedEIChooser:
         if complete.shape[0] < 2:
             return int(candidates[0])
 
-        # Grab out the relevant sets.
+        # Grab out the relevant sets.  The candidates are only looked at a
+        # chunk at a time, as there may be too many to hold at once.
         comp = grid[complete,:]
-        cand = grid[candidates,:]
         pend = grid[pending,:]
         vals = values[complete]
 
@@ -235,10 +251,9 @@ class GPConstrainedEIChooser:
                             durations[complete])
 
         # Spray a set of candidates around the min so far
-        numcand = cand.shape[0]
+        numcand = candidates.shape[0]
         best_comp = np.argmin(vals)
-        cand2 = np.vstack((np.random.randn(10,comp.shape[1])*0.001 +
-                           comp[best_comp,:], cand))
+        spray = np.random.randn(10,comp.shape[1])*0.001 + comp[best_comp,:]
 
         if self.mcmc_iters > 0:
 
@@ -282,7 +297,12 @@ class GPConstrainedEIChooser:
             self.dump_hypers()
             comp_preds = np.zeros(labels.shape[0]).flatten()
 
-            preds = self.pred_constraint_voilation(cand, comp, labels).flatten()
+            num_violating = 0
+            for start in xrange(0, numcand, self.chunk_size):
+                preds = self.pred_constraint_voilation(
+                    grid[candidates[start:start+self.chunk_size],:], comp,
+                    labels)
+                num_violating += np.sum(preds < 0.5)
             for ii in xrange(self.mcmc_iters):
                 constraint_hyper = self.constraint_hyper_samples[ii]
                 self.ff = self.ff_samples[ii]
@@ -294,7 +314,7 @@ class GPConstrainedEIChooser:
                                                              labels).flatten()
             comp_preds = comp_preds / float(self.mcmc_iters)
             logging.info('Predicting %.2f%% constraint violations (%d/%d): ',
-            np.mean(preds < 0.5)*100, np.sum(preds < 0.5), preds.shape[0])
+            num_violating*100.0/max(numcand, 1), num_violating, numcand)
             if self.verbosity > 0:
                 logging.info('Prediction` %f%% train accuracy (%d/%d): ',
                     np.mean((comp_preds > 0.5) == labels),
@@ -372,23 +392,48 @@ class GPConstrainedEIChooser:
                 plt.savefig('constrained_ei_chooser_ei_contour.pdf')
                 #plt.show()
 
-            # Pick the top candidates to optimize over
-            overall_ei = self.ei_over_hypers(comp,pend,cand2,vals,labels)
-            inds = np.argsort(np.mean(overall_ei, axis=1))[-self.grid_subset:]
+            # What the GPs predict under each hyperparameter sample depends
+            # only on the jobs, so work it out once for all the candidates.
+            self.posteriors = self.stacked_posteriors(comp, pend, vals, labels)
+
+            def score(cand):
+                return np.mean(self.ei_over_hypers(comp, pend, cand, vals,
+                                                   labels), axis=1)
+
+            # Pick the top candidates to optimize over, from the best of
+            # the grid and the sprayed points.
+            top, top_cand, top_ei = util.top_candidates(score, grid,
+                                                        candidates,
+                                                        self.grid_subset,
+                                                        self.chunk_size)
+            cand2 = np.vstack((spray, top_cand))
+            overall_ei = np.hstack((score(spray), top_ei))
+            inds = np.argsort(overall_ei)[-self.grid_subset:]
             cand2 = cand2[inds,:]
 
             # Adjust the candidates to hit ei peaks
             b = []# optimization bounds
-            for i in xrange(0, cand.shape[1]):
+            for i in xrange(0, comp.shape[1]):
                 b.append((0, 1))
 
-            # Optimize each point in parallel
-            pool = multiprocessing.Pool(self.grid_subset)
-            results = [pool.apply_async(optimize_pt,args=(
-                        c,b,comp,pend,vals,labels, copy.copy(self))) for c in cand2]
-            for res in results:
-                cand = np.vstack((cand, res.get(1024)))
-            pool.close()
+            # Optimize the points in parallel, a round at a time.  The
+            # model goes to each worker once, rather than with every point.
+            def run_round(items):
+                return self.pool.map(optimize_pt, items)
+
+            self.pool.share(b, comp, pend, vals, labels, self)
+            try:
+                points, _, info = multistart.minimize(
+                    self.grad_optimize_ei_over_hypers, cand2, b,
+                    (comp, pend, vals, labels),
+                    -overall_ei[inds]*self.mcmc_iters,
+                    batch=self.pool.processes, run=run_round)
+            finally:
+                self.pool.unshare()
+            logging.info("Optimized %d starts: %d duplicates, %d abandoned, "
+                         "%d rounds, %d evaluations", info['starts'],
+                         info['duplicates'], info['abandoned'],
+                         info['rounds'], info['evaluations'])
 
             #for i in xrange(0, cand2.shape[0]):
             #    log("Optimizing candidate %d/%d\n" %
@@ -400,16 +445,18 @@ class GPConstrainedEIChooser:
             #                            bounds=b, disp=0)
             #    cand2[i,:] = ret[0]
 
-            cand = np.vstack((cand, cand2))
-
-            overall_ei = self.ei_over_hypers(comp,pend,cand,vals,labels)
-            best_cand = np.argmax(np.mean(overall_ei, axis=1))
+            # Constrained EI does not depend on the other points scored
+            # with it, so the best of the optimized points and their starts
+            # only has to beat the best candidate.
+            cand2 = np.vstack((points, cand2))
+            opt_ei = score(cand2)
+            best_cand = np.argmax(opt_ei)
 
             self.dump_hypers()
-            if (best_cand >= numcand):
-                return (int(numcand), cand[best_cand,:])
+            if top.shape[0] == 0 or opt_ei[best_cand] > top_ei[0]:
+                return (int(numcand), cand2[best_cand,:])
 
-            return int(candidates[best_cand])
+            return int(candidates[top[0]])
 
         else:
             print ('This Chooser module permits only slice sampling with > 0 '
@@ -441,26 +488,50 @@ class GPConstrainedEIChooser:
 
         return func_m
 
-    # Compute EI over hyperparameter samples
+    # The GP of the objective, given the valid jobs and fantasized
+    # outcomes of the pending ones, and that of the classifier's latent
+    # function, under each hyperparameter sample, stacked, along with the
+    # gains of the classifier.  Each sample sees the same fantasies, as
+    # in grad_optimize_ei.
+    def stacked_posteriors(self, comp, pend, vals, labels):
+        good = labels > 0
+
+        posteriors = []
+        for hyper in self.hyper_samples[:self.mcmc_iters]:
+            if pend.shape[0] > 0:
+                npr.set_state(self.randomstate)
+            posteriors.append(gp.condition(self.cov_func, hyper, comp[good,:],
+                                           vals[good], pend,
+                                           self.pending_samples))
+
+        # The classifier is not conditioned on the pending jobs, and its
+        # latent function has no mean.
+        no_pend = np.zeros((0, comp.shape[1]))
+        constraint_posteriors = [
+            gp.condition(self.cov_func,
+                         (0.0, self.constraint_noise, hyper[2], hyper[3]),
+                         comp, self.ff, no_pend, 0)
+            for hyper in self.constraint_hyper_samples[:self.mcmc_iters]]
+        gains = np.array([hyper[1] for hyper in
+                          self.constraint_hyper_samples[:self.mcmc_iters]])
+
+        return (gp.PosteriorStack(posteriors),
+                gp.PosteriorStack(constraint_posteriors), gains)
+
+    # Compute EI over hyperparameter samples, weighted by the probability
+    # of not violating the constraints, for all of the samples at once.
     def ei_over_hypers(self,comp,pend,cand,vals,labels):
-        overall_ei = np.zeros((cand.shape[0], self.mcmc_iters))
-        for mcmc_iter in xrange(self.mcmc_iters):
-            hyper = self.hyper_samples[mcmc_iter]
-            constraint_hyper = self.constraint_hyper_samples[mcmc_iter]
-            self.mean = hyper[0]
-            self.noise = hyper[1]
-            self.amp2 = hyper[2]
-            self.ls = hyper[3]
+        posteriors, constraint_posteriors, gains = self.posteriors
 
-            self.constraint_mean = constraint_hyper[0]
-            self.constraint_gain = constraint_hyper[1]
-            self.constraint_amp2 = constraint_hyper[2]
-            self.constraint_ls = constraint_hyper[3]
-            overall_ei[:,mcmc_iter] = self.compute_constrained_ei(comp, pend,
-                                                                  cand, vals,
-                                                                  labels)
+        # Use standard EI if there aren't enough observations of either
+        # positive or negative constraint violations
+        if (np.all(labels > 0) or np.all(labels <= 0)):
+            func_constraint_m = sps.norm.cdf(gains)
+        else:
+            func_constraint_m = sps.norm.cdf(
+                gains*constraint_posteriors.predict_mean(cand))
 
-        return overall_ei
+        return posteriors.ei(cand)*func_constraint_m
 
     # Adjust points by optimizing EI over a set of hyperparameter samples
     def grad_optimize_ei_over_hypers(self, cand, comp, pend, vals, labels,
@@ -1039,7 +1110,7 @@ class GPConstrainedEIChooser:
             if np.any(ls < 0) or np.any(ls > self.max_ls):
                 return -np.inf
 
-            cov   = (self.amp2 * (self.cov_func(ls, comp, None) +
+            cov   = (self.amp2 * (self.kernels.cov(self.cov_func, ls, comp) +
                                   1e-6*np.eye(comp.shape[0])) +
                      self.noise*np.eye(comp.shape[0]))
             chol  = spla.cholesky(cov, lower=True)
@@ -1048,7 +1119,7 @@ class GPConstrainedEIChooser:
                       0.5*np.dot(vals-self.mean, solve))
             return lp
 
-        self.ls = util.slice_sample(self.ls, logprob, compwise=True)
+        self.ls = self.samplers['ls'].sample(self.ls, logprob, compwise=True)
 
     def _sample_constraint_ls(self, comp, vals):
         def lpProbit(ff, gain=self.constraint_gain):
@@ -1085,17 +1156,17 @@ class GPConstrainedEIChooser:
             if np.any(ls < 0) or np.any(ls > self.constraint_max_ls):
                 return -np.inf
 
-            cov   = self.constraint_amp2 * (self.cov_func(ls, comp, None) + 1e-6*np.eye(comp.shape[0])) + self.constraint_noise*np.eye(comp.shape[0])
+            cov   = self.constraint_amp2 * (self.kernels.cov(self.cov_func, ls, comp) + 1e-6*np.eye(comp.shape[0])) + self.constraint_noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), self.ff)
             lp   = lpProbit(self.ff)
 
             return lp
 
-        hypers = util.slice_sample(self.constraint_ls, logprob, compwise=True)
+        hypers = self.samplers['constraint_ls'].sample(self.constraint_ls, logprob, compwise=True)
         self.constraint_ls = hypers
 
-        cov   = self.constraint_amp2 * (self.cov_func(self.constraint_ls, comp, None) + 1e-6*np.eye(comp.shape[0])) + self.constraint_noise*np.eye(comp.shape[0])
+        cov   = self.constraint_amp2 * (self.kernels.cov(self.cov_func, self.constraint_ls, comp) + 1e-6*np.eye(comp.shape[0])) + self.constraint_noise*np.eye(comp.shape[0])
         chol  = spla.cholesky(cov, lower=False)
         ff = self.ff
         for jj in xrange(20):
@@ -1104,8 +1175,8 @@ class GPConstrainedEIChooser:
         self.ff = ff
 
         # Update gain
-        hypers = util.slice_sample(np.array([self.constraint_gain]),
-                                   updateGain, compwise=True)
+        hypers = self.samplers['constraint_gain'].sample(
+                     np.array([self.constraint_gain]), updateGain, compwise=True)
         self.constraint_gain = hypers[0]
 
     def _sample_noisy(self, comp, vals):
@@ -1121,7 +1192,7 @@ class GPConstrainedEIChooser:
             if amp2 < 0 or noise < 0:
                 return -np.inf
 
-            cov   = amp2 * ((self.cov_func(self.ls, comp, None) +
+            cov   = amp2 * ((self.kernels.cov(self.cov_func, self.ls, comp) +
                             1e-6*np.eye(comp.shape[0])) +
                             noise*np.eye(comp.shape[0]))
             chol  = spla.cholesky(cov, lower=True)
@@ -1136,9 +1207,9 @@ class GPConstrainedEIChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.array(
+        hypers = self.samplers['hypers'].sample(np.array(
                     [self.mean, self.amp2, self.noise]),
-                                   logprob, compwise=False)
+                                                logprob, compwise=False)
         self.mean  = hypers[0]
         self.amp2  = hypers[1]
         self.noise = hypers[2]
@@ -1169,7 +1240,7 @@ class GPConstrainedEIChooser:
                 return -np.inf
 
             noise = self.constraint_noise
-            cov   = amp2 * (self.cov_func(self.constraint_ls, comp, None) + 1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
+            cov   = amp2 * (self.kernels.cov(self.cov_func, self.constraint_ls, comp) + 1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), ff)
             lp    = -np.sum(np.log(np.diag(chol)))-0.5*np.dot(ff, solve)
@@ -1181,12 +1252,13 @@ class GPConstrainedEIChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.hstack((np.array([self.constraint_amp2]),
-                                            self.ff)), logprob, compwise=False)
+        hypers = self.samplers['constraint_hypers'].sample(
+                     np.hstack((np.array([self.constraint_amp2]), self.ff)),
+                     logprob, compwise=False)
         self.constraint_amp2  = hypers[0]
         self.ff = hypers[1:]
         cov   = self.constraint_amp2 * ((
-                    self.cov_func(self.constraint_ls, comp, None) +
+                    self.kernels.cov(self.cov_func, self.constraint_ls, comp) +
                     1e-6*np.eye(comp.shape[0])) +
                                 self.constraint_noise*np.eye(comp.shape[0]))
         chol  = spla.cholesky(cov, lower=False)
@@ -1208,7 +1280,7 @@ class GPConstrainedEIChooser:
             if amp2 < 0:
                 return -np.inf
 
-            cov   = amp2 * ((self.cov_func(self.ls, comp, None) +
+            cov   = amp2 * ((self.kernels.cov(self.cov_func, self.ls, comp) +
                              1e-6*np.eye(comp.shape[0])) +
                             noise*np.eye(comp.shape[0]))
             chol  = spla.cholesky(cov, lower=True)
@@ -1220,7 +1292,7 @@ class GPConstrainedEIChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.array(
+        hypers = self.samplers['hypers'].sample(np.array(
                  [self.mean, self.amp2, self.noise]), logprob, compwise=False)
         self.mean  = hypers[0]
         self.amp2  = hypers[1]
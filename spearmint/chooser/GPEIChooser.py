@@ -20,6 +20,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
+import collections
 from spearmint import gp
 import sys
 from spearmint import util
@@ -48,15 +49,25 @@ is used to sample Gaussian process hyperparameters for the GP.
 class GPEIChooser:
 
     def __init__(self, expt_dir, covar="Matern52", mcmc_iters=10,
-                 pending_samples=100, noiseless=False):
+                 pending_samples=100, noiseless=False, chunk_size=10000,
+                 ei_memory=gp.EI_MEMORY/2**20):
         self.cov_func        = getattr(gp, covar)
         self.state_pkl       = os.path.join(expt_dir, self.__module__ + ".pkl")
 
         self.mcmc_iters      = int(mcmc_iters)
-        self.pending_samples = pending_samples
+        self.pending_samples = int(pending_samples)
         self.D               = -1
         self.hyper_iters     = 1
         self.noiseless       = bool(int(noiseless))
+        # Number of candidates scored at a time
+        self.chunk_size      = int(chunk_size)
+        # Memory for scoring a block of candidates at a time, in MB
+        self.ei_memory       = float(ei_memory) * 2**20
+        # Kernel matrices of comp for recent length scales
+        self.kernels         = gp.KernelCache()
+        # Slice samplers, with their step sizes, for each block of
+        # hyperparameters
+        self.samplers        = collections.defaultdict(util.SliceSampler)
 
         self.noise_scale = 0.1  # horseshoe prior
         self.amp2_scale  = 1    # zero-mean log normal prior
@@ -126,16 +137,15 @@ class GPEIChooser:
         if self.D == -1:
             self._real_init(grid.shape[1], values[complete])
 
-        # Grab out the relevant sets.
+        # Grab out the relevant sets.  The candidates are only looked at a
+        # chunk at a time, as there may be too many to hold at once.
         comp = grid[complete,:]
-        cand = grid[candidates,:]
         pend = grid[pending,:]
         vals = values[complete]
 
         if self.mcmc_iters > 0:
             # Sample from hyperparameters.
-
-            overall_ei = np.zeros((cand.shape[0], self.mcmc_iters))
+            hyper_samples = []
 
             for mcmc_iter in xrange(self.mcmc_iters):
 
@@ -144,11 +154,8 @@ class GPEIChooser:
                                  self.mean, np.sqrt(self.amp2), self.noise, 
                                  np.min(self.ls), np.max(self.ls))
 
-                overall_ei[:,mcmc_iter] = self.compute_ei(comp, pend, cand, vals)
-
-            best_cand = np.argmax(np.mean(overall_ei, axis=1))
-
-            return int(candidates[best_cand])
+                hyper_samples.append((self.mean, self.noise, self.amp2,
+                                      self.ls.copy()))
 
         else:
             # Optimize hyperparameters
@@ -165,101 +172,29 @@ class GPEIChooser:
                              self.mean, np.sqrt(self.amp2), self.noise, np.min(self.ls),
                                 np.max(self.ls))
 
-            ei = self.compute_ei(comp, pend, cand, vals)
-
-            best_cand = np.argmax(ei)
-
-            return int(candidates[best_cand])
-
-    def compute_ei(self, comp, pend, cand, vals):
-        if pend.shape[0] == 0:
-            # If there are no pending, don't do anything fancy.
-
-            # Current best.
-            best = np.min(vals)
-
-            # The primary covariances for prediction.
-            comp_cov   = self.cov(comp)
-            cand_cross = self.cov(comp, cand)
-
-            # Compute the required Cholesky.
-            obsv_cov  = comp_cov + self.noise*np.eye(comp.shape[0])
-            obsv_chol = spla.cholesky( obsv_cov, lower=True )
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((obsv_chol, True), vals - self.mean)
-            beta   = spla.solve_triangular(obsv_chol, cand_cross, lower=True)
-
-            # Predict the marginal means and variances at candidates.
-            func_m = np.dot(cand_cross.T, alpha) + self.mean
-            func_v = self.amp2*(1+1e-6) - np.sum(beta**2, axis=0)
-
-            # Expected improvement
-            func_s = np.sqrt(func_v)
-            u      = (best - func_m) / func_s
-            ncdf   = sps.norm.cdf(u)
-            npdf   = sps.norm.pdf(u)
-            ei     = func_s*( u*ncdf + npdf)
+            hyper_samples = [(self.mean, self.noise, self.amp2, self.ls)]
 
-            return ei
-        else:
-            # If there are pending experiments, fantasize their outcomes.
-
-            # Create a composite vector of complete and pending.
-            comp_pend = np.concatenate((comp, pend))
-
-            # Compute the covariance and Cholesky decomposition.
-            comp_pend_cov  = self.cov(comp_pend) + self.noise*np.eye(comp_pend.shape[0])
-            comp_pend_chol = spla.cholesky(comp_pend_cov, lower=True)
-
-            # Compute submatrices.
-            pend_cross = self.cov(comp, pend)
-            pend_kappa = self.cov(pend)
-
-            # Use the sub-Cholesky.
-            obsv_chol = comp_pend_chol[:comp.shape[0],:comp.shape[0]]
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((obsv_chol, True), vals - self.mean)
-            beta   = spla.cho_solve((obsv_chol, True), pend_cross)
-
-            # Finding predictive means and variances.
-            pend_m = np.dot(pend_cross.T, alpha) + self.mean
-            pend_K = pend_kappa - np.dot(pend_cross.T, beta)
+        # Condition on the jobs once for every sample, so that each chunk
+        # of candidates is scored under all of them at once against the
+        # same fantasized outcomes of the pending jobs.
+        posteriors = gp.PosteriorStack(
+            [gp.condition(self.cov_func, hyper, comp, vals, pend,
+                          self.pending_samples, memory=self.ei_memory)
+             for hyper in hyper_samples], self.ei_memory)
 
-            # Take the Cholesky of the predictive covariance.
-            pend_chol = spla.cholesky(pend_K, lower=True)
+        def score(cand):
+            return np.mean(posteriors.ei(cand), axis=1)
 
-            # Make predictions.
-            pend_fant = (np.dot(pend_chol, npr.randn(pend.shape[0],self.pending_samples))
-                         + pend_m[:,None])
+        best_cand = util.top_candidates(score, grid, candidates, 1,
+                                        self.chunk_size)[0][0]
 
-            # Include the fantasies.
-            fant_vals = np.concatenate((np.tile(vals[:,np.newaxis],
-                                                (1,self.pending_samples)), pend_fant))
+        return int(candidates[best_cand])
 
-            # Compute bests over the fantasies.
-            bests = np.min(fant_vals, axis=0)
-
-            # Now generalize from these fantasies.
-            cand_cross = self.cov(comp_pend, cand)
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((comp_pend_chol, True), fant_vals - self.mean)
-            beta   = spla.solve_triangular(comp_pend_chol, cand_cross, lower=True)
-
-            # Predict the marginal means and variances at candidates.
-            func_m = np.dot(cand_cross.T, alpha) + self.mean
-            func_v = self.amp2*(1+1e-6) - np.sum(beta**2, axis=0)
-
-            # Expected improvement
-            func_s = np.sqrt(func_v[:,np.newaxis])
-            u      = (bests[np.newaxis,:] - func_m) / func_s
-            ncdf   = sps.norm.cdf(u)
-            npdf   = sps.norm.pdf(u)
-            ei     = func_s*( u*ncdf + npdf)
-
-            return np.mean(ei, axis=1)
+    def compute_ei(self, comp, pend, cand, vals):
+        hyper = (self.mean, self.noise, self.amp2, self.ls)
+        return gp.condition(self.cov_func, hyper, comp, vals, pend,
+                            self.pending_samples,
+                            memory=self.ei_memory).ei(cand)
 
     def sample_hypers(self, comp, vals):
         if self.noiseless:
@@ -274,13 +209,13 @@ class GPEIChooser:
             if np.any(ls < 0) or np.any(ls > self.max_ls):
                 return -np.inf
 
-            cov   = self.amp2 * (self.cov_func(ls, comp, None) + 1e-6*np.eye(comp.shape[0])) + self.noise*np.eye(comp.shape[0])
+            cov   = self.amp2 * (self.kernels.cov(self.cov_func, ls, comp) + 1e-6*np.eye(comp.shape[0])) + self.noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), vals - self.mean)
             lp    = -np.sum(np.log(np.diag(chol)))-0.5*np.dot(vals-self.mean, solve)
             return lp
 
-        self.ls = util.slice_sample(self.ls, logprob, compwise=True)
+        self.ls = self.samplers['ls'].sample(self.ls, logprob, compwise=True)
 
     def _sample_noisy(self, comp, vals):
         def logprob(hypers):
@@ -295,7 +230,7 @@ class GPEIChooser:
             if amp2 < 0 or noise < 0:
                 return -np.inf
 
-            cov   = amp2 * (self.cov_func(self.ls, comp, None) +
+            cov   = amp2 * (self.kernels.cov(self.cov_func, self.ls, comp) +
                             1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), vals - mean)
@@ -309,8 +244,8 @@ class GPEIChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.array([self.mean, self.amp2, self.noise]),
-                                   logprob, compwise=False)
+        hypers = self.samplers['hypers'].sample(np.array([self.mean, self.amp2, self.noise]),
+                                                logprob, compwise=False)
         self.mean  = hypers[0]
         self.amp2  = hypers[1]
         self.noise = hypers[2]
@@ -324,7 +259,7 @@ class GPEIChooser:
             if amp2 < 0:
                 return -np.inf
 
-            cov   = amp2 * (self.cov_func(self.ls, comp, None) +
+            cov   = amp2 * (self.kernels.cov(self.cov_func, self.ls, comp) +
                             1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), vals - mean)
@@ -335,8 +270,8 @@ class GPEIChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.array([self.mean, self.amp2, self.noise]), logprob,
-                                   compwise=False)
+        hypers = self.samplers['hypers'].sample(np.array([self.mean, self.amp2, self.noise]), logprob,
+                                                compwise=False)
         self.mean  = hypers[0]
         self.amp2  = hypers[1]
         self.noise = 1e-3
@@ -20,27 +20,25 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
+import collections
 from spearmint import gp
 import sys
 from spearmint import util
+from spearmint import multistart
 import tempfile
-import copy
 import numpy          as np
 import numpy.random   as npr
 import scipy.linalg   as spla
 import scipy.stats    as sps
 import scipy.optimize as spo
 import cPickle
-import multiprocessing
 
 from spearmint.helpers import *
 import logging
 
-def optimize_pt(c, b, comp, pend, vals, model):
-    ret = spo.fmin_l_bfgs_b(model.grad_optimize_ei_over_hypers,
-                            c.flatten(), args=(comp, pend, vals),
-                            bounds=b, disp=0)
-    return ret[0]
+def optimize_pt(item, b, comp, pend, vals, model):
+    return multistart.local_search(model.grad_optimize_ei_over_hypers,
+                                   b, (comp, pend, vals), **item)
 
 def init(expt_dir, arg_string):
     args = util.unpack_args(arg_string)
@@ -56,21 +54,46 @@ class GPEIOptChooser:
 
     def __init__(self, expt_dir, covar="Matern52", mcmc_iters=10,
                  pending_samples=100, noiseless=False, burnin=100,
-                 grid_subset=20, use_multiprocessing=True):
+                 grid_subset=20, use_multiprocessing=True, chunk_size=10000,
+                 ei_memory=gp.EI_MEMORY/2**20, min_mcmc_iters=2,
+                 map_burnin=20):
         self.cov_func        = getattr(gp, covar)
         self.state_pkl       = os.path.join(expt_dir, self.__module__ + ".pkl")
         self.stats_file      = os.path.join(expt_dir,
                                    self.__module__ + "_hyperparameters.txt")
         self.mcmc_iters      = int(mcmc_iters)
+        # Fewest samples replaced when the posterior barely changed; set
+        # it to mcmc_iters to draw them all afresh every time.
+        self.min_mcmc_iters  = min(int(min_mcmc_iters), self.mcmc_iters)
         self.burnin          = int(burnin)
+        # Burn-in when the chain starts from the most probable
+        # hyperparameters rather than the initial guesses.  On branin, 20
+        # iterations from there matched or beat 100 from the guesses.  The
+        # search for the start is skipped unless this is below burnin.
+        self.map_burnin      = int(map_burnin)
         self.needs_burnin    = True
         self.pending_samples = int(pending_samples)
         self.D               = -1
         self.hyper_iters     = 1        
         # Number of points to optimize EI over
         self.grid_subset     = int(grid_subset)
+        # Number of candidates scored at a time
+        self.chunk_size      = int(chunk_size)
+        # Memory for scoring a block of candidates at a time, in MB
+        self.ei_memory       = float(ei_memory) * 2**20
         self.noiseless       = bool(int(noiseless))
         self.hyper_samples = []
+        self.posteriors    = None
+        # The complete jobs and values the samples were drawn for
+        self.sampled_on    = None
+
+        # Factors of the observation covariance for recent hyperparameters
+        self.chol_cache = gp.CholeskyCache()
+        # Kernel matrices of comp for recent length scales
+        self.kernels    = gp.KernelCache()
+        # Slice samplers, with their step sizes, for each block of
+        # hyperparameters
+        self.samplers   = collections.defaultdict(util.SliceSampler)
 
         self.noise_scale = 0.1  # horseshoe prior
         self.amp2_scale  = 1    # zero-mean log normal prior
@@ -78,19 +101,34 @@ class GPEIOptChooser:
 
         # If multiprocessing fails or deadlocks, set this to False
         self.use_multiprocessing = bool(int(use_multiprocessing))
+        # Workers for optimizing the candidates, kept from one job to the next
+        self.pool = util.WorkerPool()
 
+    # Start the workers for the candidates before the caller starts
+    # threads or opens files that they should not inherit.
+    def start(self):
+        if self.mcmc_iters > 0 and self.use_multiprocessing:
+            self.pool.start()
+
+    def close(self):
+        self.pool.close()
 
     def dump_hypers(self):
 
-        # Write the hyperparameters out to a Pickle.
-        fh = tempfile.NamedTemporaryFile(mode='w', delete=False)
+        # Write the hyperparameters out to a Pickle, along with what it
+        # takes to carry on the chain where it left off.
+        fh = tempfile.NamedTemporaryFile(mode='wb', delete=False)
         cPickle.dump({ 'dims'          : self.D,
                        'ls'            : self.ls,
                        'amp2'          : self.amp2,
                        'noise'         : self.noise,
                        'hyper_samples' : self.hyper_samples,
-                       'mean'          : self.mean },
-                     fh)
+                       'mean'          : self.mean,
+                       'sampled_on'    : self.sampled_on,
+                       'samplers'      : dict(self.samplers),
+                       'randomstate'   : self.randomstate,
+                       'rng'           : npr.get_state() },
+                     fh, cPickle.HIGHEST_PROTOCOL)
         fh.close()
 
         # Use an atomic move for better NFS happiness.
@@ -146,7 +184,7 @@ class GPEIOptChooser:
     # Read in the chooser from file. Returns True only on success
     def _read_only(self):
         if os.path.exists(self.state_pkl):
-            fh    = open(self.state_pkl, 'r')
+            fh    = open(self.state_pkl, 'rb')
             state = cPickle.load(fh)
             fh.close()
 
@@ -165,7 +203,7 @@ class GPEIOptChooser:
 
         self.randomstate = npr.get_state()
         if os.path.exists(self.state_pkl):
-            fh    = open(self.state_pkl, 'r')
+            fh    = open(self.state_pkl, 'rb')
             state = cPickle.load(fh)
             fh.close()
 
@@ -176,6 +214,15 @@ class GPEIOptChooser:
             self.mean          = state['mean']
             self.hyper_samples = state['hyper_samples']
             self.needs_burnin  = False
+
+            # Carry on the chain, with the samplers' step sizes and the
+            # random numbers, as if there had been no restart.  Older
+            # state files only have the samples.
+            if 'rng' in state:
+                self.sampled_on  = state['sampled_on']
+                self.samplers.update(state['samplers'])
+                self.randomstate = state['randomstate']
+                npr.set_state(state['rng'])
         else:
 
             # Input dimensionality.
@@ -210,88 +257,76 @@ class GPEIOptChooser:
     # run according to the acquisition function.
     def next(self, grid, values, durations,
              candidates, pending, complete):
+        return self.next_batch(1, grid, values, durations,
+                               candidates, pending, complete)[0]
+
+    # Pick the next k experiments to run.  The hyperparameters are
+    # sampled once for all of them, and each pick is then treated as
+    # pending, with fantasized outcomes, so that the next is chosen
+    # knowing it will run.
+    def next_batch(self, k, grid, values, durations,
+                   candidates, pending, complete):
 
         # Don't bother using fancy GP stuff at first.
         if complete.shape[0] < 2:
-            return int(candidates[0])
+            return [int(c) for c in candidates[:k]]
 
         # Perform the real initialization.
         if self.D == -1:
             self._real_init(grid.shape[1], values[complete])
 
-        # Grab out the relevant sets.
+        # Grab out the relevant sets.  The candidates are only looked at a
+        # chunk at a time, as there may be too many to hold at once.
         comp = grid[complete,:]
-        cand = grid[candidates,:]
         pend = grid[pending,:]
         vals = values[complete]
-        numcand = cand.shape[0]
+        numcand = candidates.shape[0]
 
         # Spray a set of candidates around the min so far
         best_comp = np.argmin(vals)
-        cand2 = np.vstack((np.random.randn(10,comp.shape[1])*0.001 +
-                           comp[best_comp,:], cand))
+        spray = np.random.randn(10,comp.shape[1])*0.001 + comp[best_comp,:]
 
         if self.mcmc_iters > 0:
 
-            # Possibly burn in.
+            # Possibly burn in.  Starting from the most likely
+            # hyperparameters, the chain has less far to go, so it is
+            # given the shorter map_burnin.
             if self.needs_burnin:
-                for mcmc_iter in xrange(self.burnin):
+                burnin = self.burnin
+                if (self.map_burnin < self.burnin and
+                    self._start_from_map(comp, vals)):
+                    burnin = self.map_burnin
+                for mcmc_iter in xrange(burnin):
                     self.sample_hypers(comp, vals)
                     logging.info("BURN %d/%d] mean: %.2f  amp: %.2f "
                                      "noise: %.4f  min_ls: %.4f  max_ls: %.4f",
-                                     mcmc_iter+1, self.burnin, self.mean,
+                                     mcmc_iter+1, burnin, self.mean,
                                         np.sqrt(self.amp2), self.noise,
                                         np.min(self.ls), np.max(self.ls))
-                self.needs_burnin = False
+                self.hyper_samples = []
+                self.needs_burnin  = False
 
-            # Sample from hyperparameters.
+            # Sample from hyperparameters, carrying on the chain.  Only
+            # as many samples are replaced as the new jobs call for.
             # Adjust the candidates to hit ei peaks
-            self.hyper_samples = []
-            for mcmc_iter in xrange(self.mcmc_iters):
+            num_new = self._samples_needed(comp, vals)
+            keep    = self.mcmc_iters - num_new
+            self.hyper_samples = self.hyper_samples[len(self.hyper_samples)-keep:]
+            for mcmc_iter in xrange(num_new):
                 self.sample_hypers(comp, vals)
                 logging.info("%d/%d] mean: %.2f  amp: %.2f  noise: %.4f "
                                  "min_ls: %.4f  max_ls: %.4f",
-                                    mcmc_iter+1, self.mcmc_iters, self.mean,
+                                    mcmc_iter+1, num_new, self.mean,
                                     np.sqrt(self.amp2), self.noise,
                                     np.min(self.ls), np.max(self.ls))
+            self.sampled_on = (comp, vals)
+            logging.info("log probabilities per slice sample: %s",
+                         "  ".join("%s: %.1f" % (name,
+                                   sampler.evaluations_per_sample())
+                                   for name, sampler in
+                                   sorted(self.samplers.items())))
             self.dump_hypers()
-
-            b = []# optimization bounds
-            for i in xrange(0, cand.shape[1]):
-                b.append((0, 1))
-
-            overall_ei = self.ei_over_hypers(comp,pend,cand2,vals)
-            inds = np.argsort(np.mean(overall_ei,axis=1))[-self.grid_subset:]
-            cand2 = cand2[inds,:]
-
-            # Optimize each point in parallel
-            if self.use_multiprocessing:
-                pool = multiprocessing.Pool(self.grid_subset)
-                results = [pool.apply_async(optimize_pt,args=(
-                            c,b,comp,pend,vals,copy.copy(self))) for c in cand2]
-                for res in results:
-                    cand = np.vstack((cand, res.get(1e8)))
-                pool.close()
-            else:
-                # This is old code to optimize each point in parallel.
-                for i in xrange(0, cand2.shape[0]):
-                    logging.info("Optimizing candidate %d/%d", i+1, 
-                            cand2.shape[0])
-                    #self.check_grad_ei(cand2[i,:].flatten(), comp, pend, vals)
-                    ret = spo.fmin_l_bfgs_b(self.grad_optimize_ei_over_hypers,
-                                            cand2[i,:].flatten(), args=(comp,pend,vals),
-                                            bounds=b, disp=0)
-                    cand2[i,:] = ret[0]
-                cand = np.vstack((cand, cand2))
-
-            overall_ei = self.ei_over_hypers(comp,pend,cand,vals)
-            best_cand = np.argmax(np.mean(overall_ei, axis=1))
-
-            if (best_cand >= numcand):
-                return (int(numcand), cand[best_cand,:])
-
-            return int(candidates[best_cand])
-
+            hyper_samples = self.hyper_samples
         else:
             # Optimize hyperparameters
             self.optimize_hypers(comp, vals)
@@ -300,39 +335,98 @@ class GPEIOptChooser:
                              "min_ls: %.4f  max_ls: %.4f", 
                              self.mean, np.sqrt(self.amp2), self.noise,
                             np.min(self.ls), np.max(self.ls))
+            hyper_samples = [None]
+
+        jobs = []
+        for i in xrange(k):
+            job = self.choose(grid, candidates, numcand, comp, pend, vals,
+                              spray, hyper_samples)
+            jobs.append(job)
+            if i == k-1:
+                break
+
+            if isinstance(job, tuple):
+                pend = np.vstack((pend, job[1]))
+            else:
+                pend       = np.vstack((pend, grid[job,:]))
+                candidates = candidates[candidates != job]
+            logging.info("Picked %d/%d of the batch", i+1, k)
+
+        return jobs
+
+    # Pick the candidate, or the new point, with the most EI over the
+    # hyperparameter samples, optimizing from the best candidates and
+    # the sprayed points.
+    def choose(self, grid, candidates, numcand, comp, pend, vals, spray,
+               hyper_samples):
+
+        # What the GP predicts under each hyperparameter sample depends
+        # only on the jobs, so work it out once for all the candidates
+        # and all the steps of the optimization.
+        self.posteriors = gp.PosteriorStack(
+            [self.posterior(comp, pend, vals, hyper) for hyper in hyper_samples],
+            self.ei_memory)
+
+        def score(cand):
+            return np.mean(self.ei_over_hypers(comp,pend,cand,vals), axis=1)
+
+        # Keep the best grid_subset candidates and start the optimization
+        # from the best of them and the sprayed points.
+        top, top_cand, top_ei = util.top_candidates(score, grid, candidates,
+                                                    self.grid_subset,
+                                                    self.chunk_size)
+        cand2   = np.vstack((top_cand, spray))
+        cand_ei = np.hstack((top_ei, score(spray)))
+        inds    = np.argsort(cand_ei)[-self.grid_subset:]
+        cand2   = self.optimize_pts(cand2[inds,:], cand_ei[inds],
+                                    comp, pend, vals)
+
+        # EI does not depend on the other points scored with it, so the
+        # best optimized point only has to beat the best candidate.
+        opt_ei    = score(cand2)
+        best_cand = np.argmax(opt_ei)
+
+        if top.shape[0] == 0 or opt_ei[best_cand] > top_ei[0]:
+            return (int(numcand), cand2[best_cand,:])
+
+        return int(candidates[top[0]])
+
+    # Optimize EI over hyperparameter samples from the starts, with
+    # their EI, and return the points reached.
+    def optimize_pts(self, starts, start_ei, comp, pend, vals):
+        b = []# optimization bounds
+        for i in xrange(0, comp.shape[1]):
+            b.append((0, 1))
+
+        # The objective sums EI over the samples.
+        values = -start_ei * len(self.posteriors)
+        args   = (comp, pend, vals)
+
+        # The model goes to each worker once, rather than with every point.
+        batch     = 1
+        run_round = None
+        if self.mcmc_iters > 0 and self.use_multiprocessing:
+            self.pool.share(b, comp, pend, vals, self)
+            batch = self.pool.processes
+            def run_round(items):
+                return self.pool.map(optimize_pt, items)
 
-            # Optimize over EI
-            b = []# optimization bounds
-            for i in xrange(0, cand.shape[1]):
-                b.append((0, 1))
-
-            for i in xrange(0, cand2.shape[0]):
-                ret = spo.fmin_l_bfgs_b(self.grad_optimize_ei,
-                                        cand2[i,:].flatten(), args=(comp,vals,True),
-                                        bounds=b, disp=0)
-                cand2[i,:] = ret[0]
-            cand = np.vstack((cand, cand2))
-
-            ei = self.compute_ei(comp, pend, cand, vals)
-            best_cand = np.argmax(ei)
-
-            if (best_cand >= numcand):
-                return (int(numcand), cand[best_cand,:])
-
-            return int(candidates[best_cand])
+        try:
+            points, _, info = multistart.minimize(
+                self.grad_optimize_ei_over_hypers, starts, b, args, values,
+                batch=batch, run=run_round)
+        finally:
+            self.pool.unshare()
+
+        logging.info("Optimized %d starts: %d duplicates, %d abandoned, "
+                     "%d rounds, %d evaluations", info['starts'],
+                     info['duplicates'], info['abandoned'], info['rounds'],
+                     info['evaluations'])
+        return points
 
     # Compute EI over hyperparameter samples
     def ei_over_hypers(self,comp,pend,cand,vals):
-        overall_ei = np.zeros((cand.shape[0], self.mcmc_iters))
-        for mcmc_iter in xrange(self.mcmc_iters):
-            hyper = self.hyper_samples[mcmc_iter]
-            self.mean = hyper[0]
-            self.noise = hyper[1]
-            self.amp2 = hyper[2]
-            self.ls = hyper[3]
-            overall_ei[:,mcmc_iter] = self.compute_ei(comp, pend, cand,
-                                                      vals)
-        return overall_ei
+        return self.posteriors.ei(cand)
 
     def check_grad_ei(self, cand, comp, pend, vals):
         (ei,dx1) = self.grad_optimize_ei_over_hypers(cand, comp, pend, vals)
@@ -354,27 +448,15 @@ class GPEIOptChooser:
     def grad_optimize_ei_over_hypers(self, cand, comp, pend, vals, compute_grad=True):
         summed_ei = 0
         summed_grad_ei = np.zeros(cand.shape).flatten()
-        ls = self.ls.copy()
-        amp2 = self.amp2
-        mean = self.mean
-        noise = self.noise
-
-        for hyper in self.hyper_samples:
-            self.mean = hyper[0]
-            self.noise = hyper[1]
-            self.amp2 = hyper[2]
-            self.ls = hyper[3]
+
+        cand = np.reshape(cand, (-1, comp.shape[1]))
+        for post in self.posteriors:
             if compute_grad:
-                (ei,g_ei) = self.grad_optimize_ei(cand,comp,pend,vals,compute_grad)
-                summed_grad_ei = summed_grad_ei + g_ei
+                (ei,g_ei) = post.grad_ei(cand)
+                summed_grad_ei = summed_grad_ei + g_ei.flatten()
             else:
-                ei = self.grad_optimize_ei(cand,comp,pend,vals,compute_grad)
-            summed_ei += ei
-
-        self.mean = mean
-        self.amp2 = amp2
-        self.noise = noise
-        self.ls = ls.copy()
+                ei = post.ei(cand)
+            summed_ei -= np.sum(ei)
 
         if compute_grad:
             return (summed_ei, summed_grad_ei)
@@ -383,230 +465,111 @@ class GPEIOptChooser:
 
     # Adjust points based on optimizing their ei
     def grad_optimize_ei(self, cand, comp, pend, vals, compute_grad=True):
-        if pend.shape[0] == 0:
-            best = np.min(vals)
-            cand = np.reshape(cand, (-1, comp.shape[1]))
-
-            # The primary covariances for prediction.
-            comp_cov   = self.cov(comp)
-            cand_cross = self.cov(comp, cand)
-
-            # Compute the required Cholesky.
-            obsv_cov  = comp_cov + self.noise*np.eye(comp.shape[0])
-            obsv_chol = spla.cholesky(obsv_cov, lower=True)
+        post = self.posterior(comp, pend, vals)
+        if not compute_grad:
+            return post.ei(np.reshape(cand, (-1, comp.shape[1])))
 
-            cov_grad_func = getattr(gp, 'grad_' + self.cov_func.__name__)
-            cand_cross_grad = cov_grad_func(self.ls, comp, cand)
-
-            # Predictive things.
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((obsv_chol, True), vals - self.mean)
-            beta   = spla.solve_triangular(obsv_chol, cand_cross, lower=True)
-
-            # Predict the marginal means and variances at candidates.
-            func_m = np.dot(cand_cross.T, alpha) + self.mean
-            func_v = self.amp2*(1+1e-6) - np.sum(beta**2, axis=0)
-
-            # Expected improvement
-            func_s = np.sqrt(func_v)
-            u      = (best - func_m) / func_s
-            ncdf   = sps.norm.cdf(u)
-            npdf   = sps.norm.pdf(u)
-            ei     = func_s*( u*ncdf + npdf)
-
-            if not compute_grad:
-                return ei
-
-            # Gradients of ei w.r.t. mean and variance
-            g_ei_m = -ncdf
-            g_ei_s2 = 0.5*npdf / func_s
-
-            # Apply covariance function
-            grad_cross = np.squeeze(cand_cross_grad)
-
-            grad_xp_m = np.dot(alpha.transpose(),grad_cross)
-            grad_xp_v = np.dot(-2*spla.cho_solve(
-                    (obsv_chol, True),cand_cross).transpose(), grad_cross)
-
-            grad_xp = 0.5*self.amp2*(grad_xp_m*g_ei_m + grad_xp_v*g_ei_s2)
-            ei = -np.sum(ei)
-
-            return ei, grad_xp.flatten()
-
-        else:
-            # If there are pending experiments, fantasize their outcomes.
-            cand = np.reshape(cand, (-1, comp.shape[1]))
-
-            # Create a composite vector of complete and pending.
-            comp_pend = np.concatenate((comp, pend))
-
-            # Compute the covariance and Cholesky decomposition.
-            comp_pend_cov  = (self.cov(comp_pend) +
-                              self.noise*np.eye(comp_pend.shape[0]))
-            comp_pend_chol = spla.cholesky(comp_pend_cov, lower=True)
-
-            # Compute submatrices.
-            pend_cross = self.cov(comp, pend)
-            pend_kappa = self.cov(pend)
-
-            # Use the sub-Cholesky.
-            obsv_chol = comp_pend_chol[:comp.shape[0],:comp.shape[0]]
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((obsv_chol, True), vals - self.mean)
-            beta   = spla.cho_solve((obsv_chol, True), pend_cross)
-
-            # Finding predictive means and variances.
-            pend_m = np.dot(pend_cross.T, alpha) + self.mean
-            pend_K = pend_kappa - np.dot(pend_cross.T, beta)
-
-            # Take the Cholesky of the predictive covariance.
-            pend_chol = spla.cholesky(pend_K, lower=True)
-
-            # Make predictions.
-            npr.set_state(self.randomstate)
-            pend_fant = np.dot(pend_chol, npr.randn(pend.shape[0],self.pending_samples)) + pend_m[:,None]
-
-            # Include the fantasies.
-            fant_vals = np.concatenate(
-                (np.tile(vals[:,np.newaxis],
-                         (1,self.pending_samples)), pend_fant))
-
-            # Compute bests over the fantasies.
-            bests = np.min(fant_vals, axis=0)
-
-            # Now generalize from these fantasies.
-            cand_cross = self.cov(comp_pend, cand)
-            cov_grad_func = getattr(gp, 'grad_' + self.cov_func.__name__)
-            cand_cross_grad = cov_grad_func(self.ls, comp_pend, cand)
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((comp_pend_chol, True),
-                                    fant_vals - self.mean)
-            beta   = spla.solve_triangular(comp_pend_chol, cand_cross,
-                                           lower=True)
-
-            # Predict the marginal means and variances at candidates.
-            func_m = np.dot(cand_cross.T, alpha) + self.mean
-            func_v = self.amp2*(1+1e-6) - np.sum(beta**2, axis=0)
-
-            # Expected improvement
-            func_s = np.sqrt(func_v[:,np.newaxis])
-            u      = (bests[np.newaxis,:] - func_m) / func_s
-            ncdf   = sps.norm.cdf(u)
-            npdf   = sps.norm.pdf(u)
-            ei     = func_s*( u*ncdf + npdf)
-
-            # Gradients of ei w.r.t. mean and variance
-            g_ei_m = -ncdf
-            g_ei_s2 = 0.5*npdf / func_s
-
-            # Apply covariance function
-            grad_cross = np.squeeze(cand_cross_grad)
-
-            grad_xp_m = np.dot(alpha.transpose(),grad_cross)
-            grad_xp_v = np.dot(-2*spla.cho_solve(
-                    (comp_pend_chol, True),cand_cross).transpose(), grad_cross)
-
-            grad_xp = 0.5*self.amp2*(grad_xp_m*np.tile(g_ei_m,(comp.shape[1],1)).T + (grad_xp_v.T*g_ei_s2).T)
-            ei = -np.mean(ei, axis=1)
-            grad_xp = np.mean(grad_xp,axis=0)
-
-            return ei, grad_xp.flatten()
+        ei, grad_xp = post.grad_ei(cand)
+        return -np.sum(ei), grad_xp.flatten()
 
     def compute_ei(self, comp, pend, cand, vals):
-        if pend.shape[0] == 0:
-            # If there are no pending, don't do anything fancy.
-
-            # Current best.
-            best = np.min(vals)
-
-            # The primary covariances for prediction.
-            comp_cov   = self.cov(comp)
-            cand_cross = self.cov(comp, cand)
-
-            # Compute the required Cholesky.
-            obsv_cov  = comp_cov + self.noise*np.eye(comp.shape[0])
-            obsv_chol = spla.cholesky( obsv_cov, lower=True )
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((obsv_chol, True), vals - self.mean)
-            beta   = spla.solve_triangular(obsv_chol, cand_cross, lower=True)
-
-            # Predict the marginal means and variances at candidates.
-            func_m = np.dot(cand_cross.T, alpha) + self.mean
-            func_v = self.amp2*(1+1e-6) - np.sum(beta**2, axis=0)
-
-            # Expected improvement
-            func_s = np.sqrt(func_v)
-            u      = (best - func_m) / func_s
-            ncdf   = sps.norm.cdf(u)
-            npdf   = sps.norm.pdf(u)
-            ei     = func_s*( u*ncdf + npdf)
-
-            return ei
-        else:
-            # If there are pending experiments, fantasize their outcomes.
-
-            # Create a composite vector of complete and pending.
-            comp_pend = np.concatenate((comp, pend))
-
-            # Compute the covariance and Cholesky decomposition.
-            comp_pend_cov  = (self.cov(comp_pend) +
-                              self.noise*np.eye(comp_pend.shape[0]))
-            comp_pend_chol = spla.cholesky(comp_pend_cov, lower=True)
-
-            # Compute submatrices.
-            pend_cross = self.cov(comp, pend)
-            pend_kappa = self.cov(pend)
-
-            # Use the sub-Cholesky.
-            obsv_chol = comp_pend_chol[:comp.shape[0],:comp.shape[0]]
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((obsv_chol, True), vals - self.mean)
-            beta   = spla.cho_solve((obsv_chol, True), pend_cross)
-
-            # Finding predictive means and variances.
-            pend_m = np.dot(pend_cross.T, alpha) + self.mean
-            pend_K = pend_kappa - np.dot(pend_cross.T, beta)
-
-            # Take the Cholesky of the predictive covariance.
-            pend_chol = spla.cholesky(pend_K, lower=True)
-
-            # Make predictions.
+        return self.posterior(comp, pend, vals).ei(cand)
+
+    # Condition the GP on the complete jobs and on fantasized outcomes of
+    # the pending ones, with the given hyperparameter sample or else the
+    # current hyperparameters.
+    def posterior(self, comp, pend, vals, hyper=None):
+        if hyper is None:
+            hyper = (self.mean, self.noise, self.amp2, self.ls)
+        mean, noise, amp2, ls = hyper
+
+        # The pending points come after the complete ones, so their
+        # factor extends that of comp.
+        def cholesky(X):
+            return self.chol_cache.cholesky(self.cov_func, ls, amp2, noise, X)
+
+        # Every sample sees the same fantasies.
+        if pend.shape[0] > 0:
             npr.set_state(self.randomstate)
-            pend_fant = np.dot(pend_chol, npr.randn(pend.shape[0],self.pending_samples)) + pend_m[:,None]
-
-            # Include the fantasies.
-            fant_vals = np.concatenate(
-                (np.tile(vals[:,np.newaxis],
-                         (1,self.pending_samples)), pend_fant))
-
-            # Compute bests over the fantasies.
-            bests = np.min(fant_vals, axis=0)
-
-            # Now generalize from these fantasies.
-            cand_cross = self.cov(comp_pend, cand)
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((comp_pend_chol, True),
-                                    fant_vals - self.mean)
-            beta   = spla.solve_triangular(comp_pend_chol, cand_cross,
-                                           lower=True)
-
-            # Predict the marginal means and variances at candidates.
-            func_m = np.dot(cand_cross.T, alpha) + self.mean
-            func_v = self.amp2*(1+1e-6) - np.sum(beta**2, axis=0)
-
-            # Expected improvement
-            func_s = np.sqrt(func_v[:,np.newaxis])
-            u      = (bests[np.newaxis,:] - func_m) / func_s
-            ncdf   = sps.norm.cdf(u)
-            npdf   = sps.norm.pdf(u)
-            ei     = func_s*( u*ncdf + npdf)
-
-            return np.mean(ei, axis=1)
+        return gp.condition(self.cov_func, hyper, comp, vals, pend,
+                            self.pending_samples, cholesky, self.ei_memory)
+
+    # The number of samples to draw for the jobs.  The samples drawn for
+    # the jobs before are weighted by how much more likely the jobs are
+    # under them than those they were drawn for.  The more even the
+    # weights, the less the posterior changed, and the fewer of the
+    # samples are replaced.
+    def _samples_needed(self, comp, vals):
+        if (self.sampled_on is None or
+            len(self.hyper_samples) < self.mcmc_iters or
+            self.sampled_on[0].shape[1] != comp.shape[1]):
+            return self.mcmc_iters
+
+        old_comp, old_vals = self.sampled_on
+        if np.array_equal(old_comp, comp) and np.array_equal(old_vals, vals):
+            return self.min_mcmc_iters
+
+        log_w = np.array([self._log_likelihood(comp, vals, hyper) -
+                          self._log_likelihood(old_comp, old_vals, hyper)
+                          for hyper in self.hyper_samples])
+        if not np.all(np.isfinite(log_w)):
+            return self.mcmc_iters
+        w = np.exp(log_w - np.max(log_w))
+
+        # Effective sample size, as a fraction of the samples
+        ess     = np.sum(w)**2 / np.sum(w**2) / len(w)
+        num_new = int(np.ceil(self.mcmc_iters * (1 - ess)))
+        num_new = min(max(num_new, self.min_mcmc_iters), self.mcmc_iters)
+        logging.info("effective sample size %.2f, drawing %d/%d samples",
+                     ess, num_new, self.mcmc_iters)
+        return num_new
+
+    # Log marginal likelihood of the values, up to a constant.
+    def _log_likelihood(self, comp, vals, hyper):
+        mean, noise, amp2, ls = hyper
+        chol  = self.chol_cache.cholesky(self.cov_func, ls, amp2, noise, comp,
+                                         remember=False,
+                                         kernel=lambda: self.kernels.cov(
+                                             self.cov_func, ls, comp))
+        solve = spla.cho_solve((chol, True), vals - mean)
+        return -np.sum(np.log(np.diag(chol))) - 0.5*np.dot(vals-mean, solve)
+
+    # Start the chain from the most probable hyperparameters under the
+    # posterior it samples, found in the logs of the positive ones.
+    # Returns False, leaving the initial guesses, if it fails.
+    def _start_from_map(self, comp, vals):
+        def nlogprob(hypers):
+            mean  = hypers[0]
+            amp2  = np.exp(hypers[1])
+            noise = 1e-3 if self.noiseless else np.exp(hypers[2])
+            ls    = np.exp(hypers[3:])
+            try:
+                lp = self._log_likelihood(comp, vals, (mean, noise, amp2, ls))
+            except (np.linalg.LinAlgError, ValueError):
+                return np.inf
+
+            if not self.noiseless:
+                lp += np.log(np.log(1 + (self.noise_scale/noise)**2))
+            lp -= 0.5*(np.log(np.sqrt(amp2))/self.amp2_scale)**2
+            return -lp
+
+        hypers = np.hstack((self.mean, np.log(self.amp2), np.log(self.noise),
+                            np.log(self.ls)))
+        b = [(np.min(vals), np.max(vals)), (-10, 10), (np.log(1e-6), 0)]
+        for i in xrange(comp.shape[1]):
+            b.append((np.log(1e-4), np.log(self.max_ls)))
+
+        hypers, nlp, _ = spo.fmin_l_bfgs_b(nlogprob, hypers, bounds=b,
+                                           approx_grad=True, disp=0)
+        if not np.isfinite(nlp):
+            return False
+
+        self.mean = hypers[0]
+        self.amp2 = np.exp(hypers[1])
+        self.ls   = np.exp(hypers[3:])
+        if not self.noiseless:
+            self.noise = np.exp(hypers[2])
+        return True
 
     def sample_hypers(self, comp, vals):
         if self.noiseless:
@@ -622,15 +585,16 @@ class GPEIOptChooser:
             if np.any(ls < 0) or np.any(ls > self.max_ls):
                 return -np.inf
 
-            cov   = (self.amp2 * (self.cov_func(ls, comp, None) +
-                1e-6*np.eye(comp.shape[0])) + self.noise*np.eye(comp.shape[0]))
-            chol  = spla.cholesky(cov, lower=True)
+            chol  = self.chol_cache.cholesky(self.cov_func, ls, self.amp2,
+                                             self.noise, comp, remember=False,
+                                             kernel=lambda: self.kernels.cov(
+                                                 self.cov_func, ls, comp))
             solve = spla.cho_solve((chol, True), vals - self.mean)
             lp    = (-np.sum(np.log(np.diag(chol))) -
                       0.5*np.dot(vals-self.mean, solve))
             return lp
 
-        self.ls = util.slice_sample(self.ls, logprob, compwise=True)
+        self.ls = self.samplers['ls'].sample(self.ls, logprob, compwise=True)
 
     def _sample_noisy(self, comp, vals):
         def logprob(hypers):
@@ -645,9 +609,10 @@ class GPEIOptChooser:
             if amp2 < 0 or noise < 0:
                 return -np.inf
 
-            cov   = (amp2 * (self.cov_func(self.ls, comp, None) +
-                1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0]))
-            chol  = spla.cholesky(cov, lower=True)
+            chol  = self.chol_cache.cholesky(self.cov_func, self.ls, amp2,
+                                             noise, comp, remember=False,
+                                             kernel=lambda: self.kernels.cov(
+                                                 self.cov_func, self.ls, comp))
             solve = spla.cho_solve((chol, True), vals - mean)
             lp    = -np.sum(np.log(np.diag(chol)))-0.5*np.dot(vals-mean, solve)
 
@@ -659,7 +624,7 @@ class GPEIOptChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.array(
+        hypers = self.samplers['hypers'].sample(np.array(
                 [self.mean, self.amp2, self.noise]), logprob, compwise=False)
         self.mean  = hypers[0]
         self.amp2  = hypers[1]
@@ -678,9 +643,10 @@ class GPEIOptChooser:
             if amp2 < 0:
                 return -np.inf
 
-            cov   = (amp2 * (self.cov_func(self.ls, comp, None) +
-                1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0]))
-            chol  = spla.cholesky(cov, lower=True)
+            chol  = self.chol_cache.cholesky(self.cov_func, self.ls, amp2,
+                                             noise, comp, remember=False,
+                                             kernel=lambda: self.kernels.cov(
+                                                 self.cov_func, self.ls, comp))
             solve = spla.cho_solve((chol, True), vals - mean)
             lp    = -np.sum(np.log(np.diag(chol)))-0.5*np.dot(vals-mean, solve)
 
@@ -689,7 +655,7 @@ class GPEIOptChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.array(
+        hypers = self.samplers['hypers'].sample(np.array(
                 [self.mean, self.amp2, self.noise]), logprob, compwise=False)
         self.mean  = hypers[0]
         self.amp2  = hypers[1]
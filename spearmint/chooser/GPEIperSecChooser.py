@@ -20,9 +20,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
+import collections
 from spearmint import gp
 import sys
 from spearmint import util
+from spearmint import multistart
 import tempfile
 import numpy          as np
 import numpy.random   as npr
@@ -51,7 +53,8 @@ class GPEIperSecChooser:
 
     def __init__(self, expt_dir, covar="Matern52", mcmc_iters=10,
                  pending_samples=100, noiseless=False, burnin=100,
-                 grid_subset=20):
+                 grid_subset=20, ei_memory=gp.EI_MEMORY/2**20,
+                 chunk_size=10000):
         self.cov_func        = getattr(gp, covar)
         self.state_pkl       = os.path.join(expt_dir, self.__module__ + ".pkl")
 
@@ -60,11 +63,20 @@ class GPEIperSecChooser:
         self.mcmc_iters      = int(mcmc_iters)
         self.burnin          = int(burnin)
         self.needs_burnin    = True
-        self.pending_samples = pending_samples
+        self.pending_samples = int(pending_samples)
         self.D               = -1
         self.hyper_iters     = 1
         # Number of points to optimize EI over
         self.grid_subset     = int(grid_subset)
+        # Number of candidates scored at a time
+        self.chunk_size      = int(chunk_size)
+        # Memory for scoring a block of candidates at a time, in MB
+        self.ei_memory       = float(ei_memory) * 2**20
+        # Kernel matrices of comp for recent length scales
+        self.kernels         = gp.KernelCache()
+        # Slice samplers, with their step sizes, for each block of
+        # hyperparameters
+        self.samplers        = collections.defaultdict(util.SliceSampler)
         self.noiseless       = bool(int(noiseless))
         self.hyper_samples = []
         self.time_hyper_samples = []
@@ -154,14 +166,18 @@ class GPEIperSecChooser:
         if complete.shape[0] < 2:
             return int(candidates[0])
 
+        # Jobs that took no measurable time, such as memoized ones, would
+        # have no log duration.
+        durations = np.maximum(durations, 1e-6)
+
         # Perform the real initialization.
         if self.D == -1:
             self._real_init(grid.shape[1], values[complete],
                             durations[complete])
 
-        # Grab out the relevant sets.
+        # Grab out the relevant sets.  The candidates are only looked at a
+        # chunk at a time, as there may be too many to hold at once.
         comp = grid[complete,:]
-        cand = grid[candidates,:]
         pend = grid[pending,:]
         vals = values[complete]
         durs = durations[complete]
@@ -171,10 +187,9 @@ class GPEIperSecChooser:
         durs = np.log(durs)
 
         # Spray a set of candidates around the min so far
-        numcand = cand.shape[0]
+        numcand = candidates.shape[0]
         best_comp = np.argmin(vals)
-        cand2 = np.vstack((np.random.randn(10,comp.shape[1])*0.001 +
-                           comp[best_comp,:], cand))
+        spray = np.random.randn(10,comp.shape[1])*0.001 + comp[best_comp,:]
 
         if self.mcmc_iters > 0:
 
@@ -192,6 +207,7 @@ class GPEIperSecChooser:
             # Sample from hyperparameters.
             # Adjust the candidates to hit ei/sec peaks
             self.hyper_samples = []
+            self.time_hyper_samples = []
             for mcmc_iter in xrange(self.mcmc_iters):
                 self.sample_hypers(comp, vals, durs)
                 logging.info("%d/%d] mean: %.2f  amp: %.2f  noise: %.4f "
@@ -206,34 +222,9 @@ class GPEIperSecChooser:
                                     np.sqrt(self.time_amp2), np.exp(self.time_noise),
                                     np.min(self.time_ls), np.max(self.time_ls))
             self.dump_hypers()
-
-            # Pick the top candidates to optimize over
-            overall_ei = self.ei_over_hypers(comp,pend,cand2,vals,durs)
-            inds = np.argsort(np.mean(overall_ei, axis=1))[-self.grid_subset:]
-            cand2 = cand2[inds,:]
-
-            # Adjust the candidates to hit ei peaks
-            b = []# optimization bounds
-            for i in xrange(0, cand.shape[1]):
-                b.append((0, 1))
-
-            for i in xrange(0, cand2.shape[0]):
-                logging.info("Optimizing candidate %d/%d", i+1, cand2.shape[0])
-                ret = spo.fmin_l_bfgs_b(self.grad_optimize_ei_over_hypers,
-                                        cand2[i,:].flatten(),
-                                        args=(comp,vals,durs,True),
-                                        bounds=b, disp=0)
-                cand2[i,:] = ret[0]
-
-            cand = np.vstack((cand, cand2))
-
-            overall_ei = self.ei_over_hypers(comp,pend,cand,vals,durs)
-            best_cand = np.argmax(np.mean(overall_ei, axis=1))
-            self.dump_hypers()
-            if (best_cand >= numcand):
-                return (int(numcand), cand[best_cand,:])
-
-            return int(candidates[best_cand])
+            hyper_samples      = self.hyper_samples
+            time_hyper_samples = self.time_hyper_samples
+            func               = self.grad_optimize_ei_over_hypers
 
         else:
             # Optimize hyperparameters
@@ -242,56 +233,65 @@ class GPEIperSecChooser:
             logging.info("mean: %f  amp: %f  noise: %f min_ls: %f  max_ls: %f",  
                     self.mean, np.sqrt(self.amp2),
                     self.noise, np.min(self.ls), np.max(self.ls))
+            hyper_samples      = [(self.mean, self.noise, self.amp2, self.ls)]
+            time_hyper_samples = [(self.time_mean, self.time_noise,
+                                   self.time_amp2, self.time_ls)]
+            func               = self.grad_optimize_ei
+
+        # Condition on the jobs once, so that every chunk of candidates is
+        # scored against the same fantasized outcomes of the pending jobs.
+        posteriors = self.stacked_posteriors(hyper_samples, time_hyper_samples,
+                                             comp, pend, vals, durs)
+
+        def score(cand):
+            return np.mean(self.posteriors_ei_per_s(posteriors, cand), axis=1)
+
+        # Keep the best grid_subset candidates and start the optimization
+        # from the best of them and the sprayed points.
+        top, top_cand, top_ei = util.top_candidates(score, grid, candidates,
+                                                    self.grid_subset,
+                                                    self.chunk_size)
+        cand2   = np.vstack((spray, top_cand))
+        cand_ei = np.hstack((score(spray), top_ei))
+        inds    = np.argsort(cand_ei)[-self.grid_subset:]
+
+        # Adjust the candidates to hit ei peaks
+        b = []# optimization bounds
+        for i in xrange(0, comp.shape[1]):
+            b.append((0, 1))
+
+        # The objective sums EI per second over the samples.
+        cand2 = self.optimize_pts(func, cand2[inds,:],
+                                  -cand_ei[inds]*len(hyper_samples), b,
+                                  comp, vals, durs)
+
+        # EI per second does not depend on the other points scored with it,
+        # so the best optimized point only has to beat the best candidate.
+        opt_ei    = score(cand2)
+        best_cand = np.argmax(opt_ei)
+        self.dump_hypers()
 
-            # Pick the top candidates to optimize over
-            ei = self.compute_ei_per_s(comp, pend, cand2, vals, durs)
-            inds = np.argsort(np.mean(overall_ei, axis=1))[-self.grid_subset:]
-            cand2 = cand2[inds,:]
-
-            # Adjust the candidates to hit ei peaks
-            b = []# optimization bounds
-            for i in xrange(0, cand.shape[1]):
-                b.append((0, 1))
-
-            for i in xrange(0, cand2.shape[0]):
-                logging.info("Optimizing candidate %d/%d", i+1, cand2.shape[0])
-                ret = spo.fmin_l_bfgs_b(self.grad_optimize_ei,
-                                        cand2[i,:].flatten(),
-                                        args=(comp,vals,durs,True),
-                                        bounds=b, disp=0)
-                cand2[i,:] = ret[0]
-
-            cand = np.vstack((cand, cand2))
-            ei = self.compute_ei_per_s(comp, pend, cand, vals, durs)
+        if top.shape[0] == 0 or opt_ei[best_cand] > top_ei[0]:
+            return (int(numcand), cand2[best_cand,:])
 
-            best_cand = np.argmax(ei)
-            self.dump_hypers()
+        return int(candidates[top[0]])
 
-            if (best_cand >= numcand):
-                return (int(numcand), cand[best_cand,:])
+    # Optimize EI per second with func from the starts, with their values
+    # of it, and return the points reached.
+    def optimize_pts(self, func, starts, values, b, comp, vals, durs):
+        points, _, info = multistart.minimize(func, starts, b,
+                                              (comp, vals, durs, True), values)
+        logging.info("Optimized %d starts: %d duplicates, %d abandoned, "
+                     "%d rounds, %d evaluations", info['starts'],
+                     info['duplicates'], info['abandoned'], info['rounds'],
+                     info['evaluations'])
+        return points
 
-            return int(candidates[best_cand])
-
-    # Compute EI over hyperparameter samples
+    # Compute EI per second over hyperparameter samples
     def ei_over_hypers(self,comp,pend,cand,vals,durs):
-        overall_ei = np.zeros((cand.shape[0], self.mcmc_iters))
-        for mcmc_iter in xrange(self.mcmc_iters):
-            hyper = self.hyper_samples[mcmc_iter]
-            time_hyper = self.time_hyper_samples[mcmc_iter]
-            self.mean = hyper[0]
-            self.noise = hyper[1]
-            self.amp2 = hyper[2]
-            self.ls = hyper[3]
-
-            self.time_mean = time_hyper[0]
-            self.time_noise = time_hyper[1]
-            self.time_amp2 = time_hyper[2]
-            self.time_ls = time_hyper[3]
-
-            overall_ei[:,mcmc_iter] = self.compute_ei_per_s(comp, pend, cand,
-                                                            vals, durs.squeeze())
-
-            return overall_ei
+        return self.stacked_ei_per_s(self.hyper_samples,
+                                     self.time_hyper_samples,
+                                     comp, pend, cand, vals, durs.squeeze())
 
     def check_grad_ei_per(self, cand, comp, vals, durs):
         (ei,dx1) = self.grad_optimize_ei_over_hypers(cand, comp, vals, durs)
@@ -303,7 +303,7 @@ class GPEIperSecChooser:
             (ei2,tmp) = self.grad_optimize_ei_over_hypers(cand - idx, comp, vals, durs)
             dx2[i] = (ei - ei2)/(2*1e-6)
             idx[i] = 0
-       time.sleep(2)
+        time.sleep(2)
 
     # Adjust points by optimizing EI over a set of hyperparameter samples
     def grad_optimize_ei_over_hypers(self, cand, comp, vals, durs, compute_grad=True):
@@ -364,14 +364,6 @@ class GPEIperSecChooser:
         # Bring time out of the log domain
         func_time_m = np.exp(func_time_m)
 
-        # Compute derivative of cross-distances.
-        grad_cross_r = gp.grad_dist2(self.time_ls, comp, cand)
-
-        # Apply covariance function
-        cov_grad_func = getattr(gp, 'grad_' + self.cov_func.__name__)
-        cand_cross_grad = cov_grad_func(self.time_ls, comp, cand)
-        grad_cross_t = np.squeeze(cand_cross_grad)
-
         # Now compute the gradients w.r.t. ei
         # The primary covariances for prediction.
         comp_cov   = self.cov(self.amp2, self.ls, comp)
@@ -381,8 +373,6 @@ class GPEIperSecChooser:
         obsv_cov  = comp_cov + self.noise*np.eye(comp.shape[0])
         obsv_chol = spla.cholesky( obsv_cov, lower=True )
 
-        cand_cross_grad = cov_grad_func(self.ls, comp, cand)
-
         # Predictive things.
         # Solve the linear systems.
         alpha  = spla.cho_solve((obsv_chol, True), vals - self.mean)
@@ -403,137 +393,67 @@ class GPEIperSecChooser:
         if not compute_grad:
             return ei
 
-        grad_time_xp_m = np.dot(t_alpha.transpose(),grad_cross_t)
+        grad_time_xp_m = -gp.weighted_cross_grad(self.cov_func, self.time_ls,
+                                                 comp, cand, t_alpha)
 
         # Gradients of ei w.r.t. mean and variance
         g_ei_m = -ncdf
         g_ei_s2 = 0.5*npdf / func_s
 
-        # Apply covariance function
-        grad_cross = np.squeeze(cand_cross_grad)
-
-        grad_xp_m = np.dot(alpha.transpose(),grad_cross)
-        grad_xp_v = np.dot(-2*spla.cho_solve((obsv_chol, True),
-                                             cand_cross).transpose(),grad_cross)
-
-        grad_xp = 0.5*self.amp2*(grad_xp_m*g_ei_m + grad_xp_v*g_ei_s2)
+        # Apply covariance function, contracted with the weights of the
+        # mean and the variance.
+        weights = (alpha*g_ei_m -
+                   2*spla.cho_solve((obsv_chol, True), cand_cross)[:,0]*g_ei_s2)
+        grad_xp = -0.5*self.amp2*gp.weighted_cross_grad(self.cov_func, self.ls,
+                                                         comp, cand, weights)
         grad_time_xp_m = 0.5*self.time_amp2*grad_time_xp_m*func_time_m
         grad_xp = (func_time_m*grad_xp - ei*grad_time_xp_m)/(func_time_m**2)
 
         return ei_per_s, grad_xp.flatten()
 
     def compute_ei_per_s(self, comp, pend, cand, vals, durs):
-        # First we make predictions for the durations as that
-        # doesn't depend on pending experiments
-
-        # Compute covariances
-        comp_time_cov   = self.cov(self.time_amp2, self.time_ls, comp)
-        cand_time_cross = self.cov(self.time_amp2, self.time_ls,comp,cand)
-
-        # Cholesky decompositions
-        obsv_time_cov  = comp_time_cov + self.time_noise*np.eye(comp.shape[0])
-        obsv_time_chol = spla.cholesky( obsv_time_cov, lower=True )
-
-        # Linear systems
-        t_alpha  = spla.cho_solve((obsv_time_chol, True), durs - self.time_mean)
-        #t_beta   = spla.solve_triangular(obsv_time_chol, cand_time_cross, lower=True)
-
-        # Predict marginal mean times and (possibly) variances
-        func_time_m = np.dot(cand_time_cross.T, t_alpha) + self.time_mean
-        # We don't really need the time variances now
-        #func_time_v = self.time_amp2*(1+1e-6) - np.sum(t_beta**2, axis=0)
+        hyper      = (self.mean, self.noise, self.amp2, self.ls)
+        time_hyper = (self.time_mean, self.time_noise, self.time_amp2,
+                      self.time_ls)
+        return self.stacked_ei_per_s([hyper], [time_hyper], comp, pend,
+                                     cand, vals, durs)[:,0]
+
+    # EI per second at each of the candidates (rows) under each pair of
+    # objective and duration hyperparameter samples (columns), evaluated
+    # for all of the samples at once.
+    def stacked_ei_per_s(self, hyper_samples, time_hyper_samples,
+                         comp, pend, cand, vals, durs):
+        return self.posteriors_ei_per_s(
+            self.stacked_posteriors(hyper_samples, time_hyper_samples,
+                                    comp, pend, vals, durs), cand)
+
+    # The GPs of the objective, given the jobs and fantasized outcomes of
+    # the pending ones, and of the log durations, under each pair of
+    # hyperparameter samples, stacked.
+    def stacked_posteriors(self, hyper_samples, time_hyper_samples,
+                           comp, pend, vals, durs):
+        posteriors = gp.PosteriorStack(
+            [gp.condition(self.cov_func, hyper, comp, vals, pend,
+                          self.pending_samples, memory=self.ei_memory)
+             for hyper in hyper_samples], self.ei_memory)
+
+        # Durations don't depend on pending experiments, and only their
+        # means are needed.
+        no_pend = np.zeros((0, comp.shape[1]))
+        time_posteriors = gp.PosteriorStack(
+            [gp.condition(self.cov_func, hyper, comp, durs, no_pend, 0)
+             for hyper in time_hyper_samples], self.ei_memory)
+
+        return posteriors, time_posteriors
+
+    # EI per second at the candidates under the stacked GPs.
+    def posteriors_ei_per_s(self, posteriors, cand):
+        posteriors, time_posteriors = posteriors
 
         # Bring time out of the log domain
-        func_time_m = np.exp(func_time_m)
-
-        if pend.shape[0] == 0:
-            # If there are no pending, don't do anything fancy.
-
-            # Current best.
-            best = np.min(vals)
-
-            # The primary covariances for prediction.
-            comp_cov   = self.cov(self.amp2, self.ls, comp)
-            cand_cross = self.cov(self.amp2, self.ls, comp, cand)
-
-            # Compute the required Cholesky.
-            obsv_cov  = comp_cov + self.noise*np.eye(comp.shape[0])
-            obsv_chol = spla.cholesky( obsv_cov, lower=True )
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((obsv_chol, True), vals - self.mean)
-            beta   = spla.solve_triangular(obsv_chol, cand_cross, lower=True)
-
-            # Predict the marginal means and variances at candidates.
-            func_m = np.dot(cand_cross.T, alpha) + self.mean
-            func_v = self.amp2*(1+1e-6) - np.sum(beta**2, axis=0)
-
-            # Expected improvement
-            func_s = np.sqrt(func_v)
-            u      = (best - func_m) / func_s
-            ncdf   = sps.norm.cdf(u)
-            npdf   = sps.norm.pdf(u)
-            ei     = func_s*( u*ncdf + npdf)
-
-            ei_per_s = ei/func_time_m
-            return ei_per_s
-        else:
-            # If there are pending experiments, fantasize their outcomes.
-
-            # Create a composite vector of complete and pending.
-            comp_pend = np.concatenate((comp, pend))
-
-            # Compute the covariance and Cholesky decomposition.
-            comp_pend_cov  = self.cov(self.amp2, self.ls, comp_pend) + self.noise*np.eye(comp_pend.shape[0])
-            comp_pend_chol = spla.cholesky(comp_pend_cov, lower=True)
-
-            # Compute submatrices.
-            pend_cross = self.cov(self.amp2, self.ls, comp, pend)
-            pend_kappa = self.cov(self.amp2, self.ls, pend)
-
-            # Use the sub-Cholesky.
-            obsv_chol = comp_pend_chol[:comp.shape[0],:comp.shape[0]]
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((obsv_chol, True), vals - self.mean)
-            beta   = spla.cho_solve((obsv_chol, True), pend_cross)
-
-            # Finding predictive means and variances.
-            pend_m = np.dot(pend_cross.T, alpha) + self.mean
-            pend_K = pend_kappa - np.dot(pend_cross.T, beta)
-
-            # Take the Cholesky of the predictive covariance.
-            pend_chol = spla.cholesky(pend_K, lower=True)
-
-            # Make predictions.
-            pend_fant = np.dot(pend_chol, npr.randn(pend.shape[0],self.pending_samples)) + pend_m[:,None]
-
-            # Include the fantasies.
-            fant_vals = np.concatenate((np.tile(vals[:,np.newaxis],
-                                                (1,self.pending_samples)), pend_fant))
-
-            # Compute bests over the fantasies.
-            bests = np.min(fant_vals, axis=0)
-
-            # Now generalize from these fantasies.
-            cand_cross = self.cov(self.amp2, self.ls, comp_pend, cand)
-
-            # Solve the linear systems.
-            alpha  = spla.cho_solve((comp_pend_chol, True), fant_vals - self.mean)
-            beta   = spla.solve_triangular(comp_pend_chol, cand_cross, lower=True)
-
-            # Predict the marginal means and variances at candidates.
-            func_m = np.dot(cand_cross.T, alpha) + self.mean
-            func_v = self.amp2*(1+1e-6) - np.sum(beta**2, axis=0)
-
-            # Expected improvement
-            func_s = np.sqrt(func_v[:,np.newaxis])
-            u      = (bests[np.newaxis,:] - func_m) / func_s
-            ncdf   = sps.norm.cdf(u)
-            npdf   = sps.norm.pdf(u)
-            ei     = func_s*( u*ncdf + npdf)
+        func_time_m = np.exp(time_posteriors.predict_mean(cand))
 
-            return np.divide(np.mean(ei, axis=1), func_time_m)
+        return posteriors.ei(cand) / func_time_m
 
     def sample_hypers(self, comp, vals, durs):
         if self.noiseless:
@@ -555,26 +475,26 @@ class GPEIperSecChooser:
             if np.any(ls < 0) or np.any(ls > self.max_ls):
                 return -np.inf
 
-            cov   = self.amp2 * (self.cov_func(ls, comp, None) + 1e-6*np.eye(comp.shape[0])) + self.noise*np.eye(comp.shape[0])
+            cov   = self.amp2 * (self.kernels.cov(self.cov_func, ls, comp) + 1e-6*np.eye(comp.shape[0])) + self.noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), vals - self.mean)
             lp    = -np.sum(np.log(np.diag(chol)))-0.5*np.dot(vals-self.mean, solve)
             return lp
 
-        self.ls = util.slice_sample(self.ls, logprob, compwise=True)
+        self.ls = self.samplers['ls'].sample(self.ls, logprob, compwise=True)
 
     def _sample_time_ls(self, comp, vals):
         def logprob(ls):
             if np.any(ls < 0) or np.any(ls > self.time_max_ls):
                 return -np.inf
 
-            cov   = self.time_amp2 * (self.cov_func(ls, comp, None) + 1e-6*np.eye(comp.shape[0])) + self.time_noise*np.eye(comp.shape[0])
+            cov   = self.time_amp2 * (self.kernels.cov(self.cov_func, ls, comp) + 1e-6*np.eye(comp.shape[0])) + self.time_noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), vals - self.time_mean)
             lp    = -np.sum(np.log(np.diag(chol)))-0.5*np.dot(vals-self.time_mean, solve)
             return lp
 
-        self.time_ls = util.slice_sample(self.time_ls, logprob, compwise=True)
+        self.time_ls = self.samplers['time_ls'].sample(self.time_ls, logprob, compwise=True)
 
     def _sample_noisy(self, comp, vals):
         def logprob(hypers):
@@ -589,7 +509,7 @@ class GPEIperSecChooser:
             if amp2 < 0 or noise < 0:
                 return -np.inf
 
-            cov   = amp2 * (self.cov_func(self.ls, comp, None) + 1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
+            cov   = amp2 * (self.kernels.cov(self.cov_func, self.ls, comp) + 1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), vals - mean)
             lp    = -np.sum(np.log(np.diag(chol)))-0.5*np.dot(vals-mean, solve)
@@ -603,7 +523,7 @@ class GPEIperSecChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.array([self.mean, self.amp2, self.noise]), logprob, compwise=False)
+        hypers = self.samplers['hypers'].sample(np.array([self.mean, self.amp2, self.noise]), logprob, compwise=False)
         self.mean  = hypers[0]
         self.amp2  = hypers[1]
         self.noise = hypers[2]
@@ -621,7 +541,7 @@ class GPEIperSecChooser:
             if amp2 < 0 or noise < 0:
                 return -np.inf
 
-            cov   = amp2 * (self.cov_func(self.time_ls, comp, None) + 1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
+            cov   = amp2 * (self.kernels.cov(self.cov_func, self.time_ls, comp) + 1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), vals - mean)
             lp    = -np.sum(np.log(np.diag(chol)))-0.5*np.dot(vals-mean, solve)
@@ -635,7 +555,7 @@ class GPEIperSecChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.array([self.time_mean, self.time_amp2, self.time_noise]), logprob, compwise=False)
+        hypers = self.samplers['time_hypers'].sample(np.array([self.time_mean, self.time_amp2, self.time_noise]), logprob, compwise=False)
         self.time_mean  = hypers[0]
         self.time_amp2  = hypers[1]
         self.time_noise = hypers[2]
@@ -653,7 +573,7 @@ class GPEIperSecChooser:
             if amp2 < 0:
                 return -np.inf
 
-            cov   = amp2 * (self.cov_func(self.ls, comp, None) + 1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
+            cov   = amp2 * (self.kernels.cov(self.cov_func, self.ls, comp) + 1e-6*np.eye(comp.shape[0])) + noise*np.eye(comp.shape[0])
             chol  = spla.cholesky(cov, lower=True)
             solve = spla.cho_solve((chol, True), vals - mean)
             lp    = -np.sum(np.log(np.diag(chol)))-0.5*np.dot(vals-mean, solve)
@@ -663,7 +583,7 @@ class GPEIperSecChooser:
 
             return lp
 
-        hypers = util.slice_sample(np.array([self.mean, self.amp2, self.noise]), logprob, compwise=False)
+        hypers = self.samplers['hypers'].sample(np.array([self.mean, self.amp2, self.noise]), logprob, compwise=False)
         self.mean  = hypers[0]
         self.amp2  = hypers[1]
         self.noise = 1e-3
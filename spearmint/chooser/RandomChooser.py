@@ -19,6 +19,7 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from spearmint import util
 import numpy        as np
 import numpy.random as npr
 
@@ -34,3 +35,7 @@ class RandomChooser:
              candidates, pending, complete):
         return int(candidates[int(np.floor(candidates.shape[0]*npr.rand()))])
 
+    def next_batch(self, k, grid, values, durations,
+                   candidates, pending, complete):
+        return util.next_batch(self, k, grid, values, durations,
+                               candidates, pending, complete)
@@ -19,6 +19,7 @@
 # 
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from spearmint import util
 import numpy as np
 
 def init(expt_dir, arg_string):
@@ -33,3 +34,7 @@ class SequentialChooser:
              candidates, pending, complete):
         return int(candidates[0])
 
+    def next_batch(self, k, grid, values, durations,
+                   candidates, pending, complete):
+        return util.next_batch(self, k, grid, values, durations,
+                               candidates, pending, complete)
@@ -22,19 +22,31 @@
 """
 gp.py contains utility functions related to computation in Gaussian processes.
 """
+import collections
+
 import numpy as np
 import scipy.linalg as spla
 import scipy.optimize as spo
+import scipy.special as spsp
 import scipy.io as sio
-import scipy.weave
     
 SQRT_3 = np.sqrt(3.0)
 SQRT_5 = np.sqrt(5.0)
+SQRT_2PI = np.sqrt(2*np.pi)
 
 def dist2(ls, x1, x2=None):
     # Assumes NxD and MxD matrices.
-    # Compute the squared distance matrix, given length scales.
-    
+    # Compute the squared distance matrix, given length scales.  A KxD
+    # matrix of length scales gives a KxNxM stack of them, one per row,
+    # which the covariance functions pass through.
+
+    if np.ndim(ls) > 1:
+        xx1 = x1 / ls[:,np.newaxis,:]
+        xx2 = xx1 if x2 is None else x2 / ls[:,np.newaxis,:]
+        return np.maximum(-(np.matmul(xx1, 2*xx2.transpose(0,2,1))
+                            - np.sum(xx1*xx1, axis=2)[:,:,np.newaxis]
+                            - np.sum(xx2*xx2, axis=2)[:,np.newaxis,:]), 0.0)
+
     if x2 is None:
         # Find distance with self for x1.
 
@@ -53,35 +65,31 @@ def dist2(ls, x1, x2=None):
 
     return r2
 
-def grad_dist2(ls, x1, x2=None):
+def grad_dist2(ls, x1, x2=None, out=None):
+    # The gradients of dist2(ls, x1, x2)[i,j] with respect to x1[i], as an
+    # NxMxD array, written to out if it is given.
     if x2 is None:
         x2 = x1
-        
-    # Rescale.
-    x1 = x1 / ls
-    x2 = x2 / ls
-    
-    N = x1.shape[0]
-    M = x2.shape[0]
-    D = x1.shape[1]
-    gX = np.zeros((x1.shape[0],x2.shape[0],x1.shape[1]))
 
-    code = \
-    """
-    for (int i=0; i<N; i++)
-      for (int j=0; j<M; j++)
-        for (int d=0; d<D; d++)
-          gX(i,j,d) = (2/ls(d))*(x1(i,d) - x2(j,d));
-    """
-    try:
-        scipy.weave.inline(code, ['x1','x2','gX','ls','M','N','D'], \
-                       type_converters=scipy.weave.converters.blitz, \
-                       compiler='gcc')
-    except:
-        # The C code weave above is 10x faster than this:
-        for i in xrange(0,x1.shape[0]):
-            gX[i,:,:] = 2*(x1[i,:] - x2[:,:])*(1/ls)
+    gX = np.subtract(x1[:,np.newaxis,:], x2[np.newaxis,:,:], out=out)
+    gX *= 2/ls**2
+    return gX
+
+def contract_grad_dist2(ls, x1, x2, grad_r2, weights):
+    # sum_i weights[i] * grad_r2[i,j] * grad_dist2(ls, x1, x2)[i,j,:], an
+    # MxD array, without forming the NxMxD one.  weights may also be NxM,
+    # with a column for each row of x2.
+    if x2 is None:
+        x2 = x1
 
+    weights = np.asarray(weights)
+    if weights.ndim == 1:
+        weights = weights[:,np.newaxis]
+    coef = weights * grad_r2
+
+    gX  = np.dot(coef.T, x1)
+    gX -= np.sum(coef, axis=0)[:,np.newaxis] * x2
+    gX *= 2/ls**2
     return gX
 
 def SE(ls, x1, x2=None, grad=False):
@@ -93,44 +101,442 @@ def SE(ls, x1, x2=None, grad=False):
         return cov
 
 def ARDSE(ls, x1, x2=None, grad=False):
-    cov = np.exp(-0.5 * dist2(ls, x1, x2))
+    cov = _ARDSE(dist2(ls, x1, x2))
     if grad:
         return (cov, grad_ARDSE(ls, x1, x2))
     else:
         return cov
 
-def grad_ARDSE(ls, x1, x2=None):
+# The gradients of the covariance functions are with respect to x1[i], as
+# NxMxD arrays.  Given weights, they are summed over i with those weights
+# instead, as by contract_grad_dist2.  See weighted_cross_grad for the
+# gradients with respect to the candidates.
+
+def grad_ARDSE(ls, x1, x2=None, weights=None):
     r2 = dist2(ls, x1, x2)
-    r  = np.sqrt(r2)
-    return -0.5*np.exp(-0.5*r2)[:,:,np.newaxis] * grad_dist2(ls, x1, x2)
+    grad_r2 = -0.5*np.exp(-0.5*r2)
+    if weights is not None:
+        return contract_grad_dist2(ls, x1, x2, grad_r2, weights)
+    return grad_r2[:,:,np.newaxis] * grad_dist2(ls, x1, x2)
 
 def Matern32(ls, x1, x2=None, grad=False):
-    r   = np.sqrt(dist2(ls, x1, x2))
-    cov = (1 + SQRT_3*r) * np.exp(-SQRT_3*r)
+    cov = _Matern32(dist2(ls, x1, x2))
     if grad:
         return (cov, grad_Matern32(ls, x1, x2))
     else:
         return cov
 
-def grad_Matern32(ls, x1, x2=None):
+def grad_Matern32(ls, x1, x2=None, weights=None):
     r       = np.sqrt(dist2(ls, x1, x2))
     grad_r2 = -1.5*np.exp(-SQRT_3*r)
+    if weights is not None:
+        return contract_grad_dist2(ls, x1, x2, grad_r2, weights)
     return grad_r2[:,:,np.newaxis] * grad_dist2(ls, x1, x2)
 
 def Matern52(ls, x1, x2=None, grad=False):
-    r2  = np.abs(dist2(ls, x1, x2))
-    r   = np.sqrt(r2)
-    cov = (1.0 + SQRT_5*r + (5.0/3.0)*r2) * np.exp(-SQRT_5*r)
+    cov = _Matern52(dist2(ls, x1, x2))
     if grad:
         return (cov, grad_Matern52(ls, x1, x2))
     else:
         return cov
 
-def grad_Matern52(ls, x1, x2=None):
+def grad_Matern52(ls, x1, x2=None, weights=None):
     r       = np.sqrt(dist2(ls, x1, x2))
     grad_r2 = -(5.0/6.0)*np.exp(-SQRT_5*r)*(1 + SQRT_5*r)
+    if weights is not None:
+        return contract_grad_dist2(ls, x1, x2, grad_r2, weights)
     return grad_r2[:,:,np.newaxis] * grad_dist2(ls, x1, x2)
 
+# The covariance functions as functions of the scaled squared distances.
+
+def _ARDSE(r2):
+    return np.exp(-0.5 * r2)
+
+def _Matern32(r2):
+    r = np.sqrt(r2)
+    return (1 + SQRT_3*r) * np.exp(-SQRT_3*r)
+
+def _Matern52(r2):
+    r2 = np.abs(r2)
+    r  = np.sqrt(r2)
+    return (1.0 + SQRT_5*r + (5.0/3.0)*r2) * np.exp(-SQRT_5*r)
+
+class KernelCache:
+    """
+    Kernel matrices cov_func(ls, X) for the most recently used length
+    scales and inputs, as the slice sampler asks for them over and over:
+    the steps for the mean, amplitude and noise keep the length scales.
+    The squared differences of the inputs along each dimension are kept
+    too, so that the distances for new length scales are a weighted sum
+    of them.  Those take D*N^2 doubles, and are only kept up to
+    max_diffs bytes.
+    """
+
+    def __init__(self, size=8, max_diffs=64*2**20):
+        self.size      = size
+        self.max_diffs = max_diffs
+        self.entries   = collections.OrderedDict()
+        self.diffs     = collections.OrderedDict()
+
+    def __getstate__(self):
+        # Not worth shipping to other processes.
+        return { 'size' : self.size, 'max_diffs' : self.max_diffs }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def cov(self, cov_func, ls, X):
+        """cov_func(ls, X, None), which must not be modified."""
+        X     = np.asarray(X)
+        x_key = (X.shape, hash(X.tostring()))
+        key   = (cov_func.__name__, np.asarray(ls).tostring(), x_key)
+
+        entry = self.entries.pop(key, None)
+        if entry is None or not np.array_equal(entry[0], X):
+            entry = (X.copy(), self._cov(cov_func, ls, X, x_key))
+        self.entries[key] = entry
+
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+        return entry[1]
+
+    def _cov(self, cov_func, ls, X, x_key):
+        of_dist2 = globals().get('_' + cov_func.__name__)
+        if of_dist2 is None or X.nbytes * X.shape[0] > self.max_diffs:
+            return cov_func(ls, X, None)
+
+        diffs = self.diffs.pop(x_key, None)
+        if diffs is None or not np.array_equal(diffs[0], X):
+            diffs = (X.copy(), (X.T[:,:,np.newaxis] - X.T[:,np.newaxis,:])**2)
+        self.diffs[x_key] = diffs
+
+        # Two sets of inputs, e.g. of an objective and a constraint.
+        while len(self.diffs) > 2:
+            self.diffs.popitem(last=False)
+
+        return of_dist2(np.tensordot(1/np.asarray(ls, dtype=float)**2,
+                                     diffs[1], 1))
+
+class CholeskyCache:
+    """
+    Cholesky factors of GP observation covariances,
+    amp2*(cov_func(ls, X) + 1e-6*I) + noise*I, for the most recently used
+    hyperparameter settings.  Asking again for the same inputs returns the
+    cached factor, and asking for the cached inputs with rows appended
+    (a new observation, or pending points after the complete ones) extends
+    it in O(N^2 M) rather than refactoring in O(N^3).
+    """
+
+    def __init__(self, size=32):
+        self.size    = size
+        self.entries = collections.OrderedDict()
+
+    def __getstate__(self):
+        # Not worth shipping to other processes.
+        return { 'size' : self.size }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def cholesky(self, cov_func, ls, amp2, noise, X, remember=True,
+                 kernel=None):
+        # kernel, if given, is a function returning cov_func(ls, X, None),
+        # called only when the factor has to be computed from scratch.
+        key   = (cov_func.__name__, np.asarray(ls).tostring(),
+                 float(amp2), float(noise))
+        entry = self.entries.pop(key, None)
+
+        if entry is None or not self._is_prefix(entry[0], X):
+            chol = spla.cholesky(self._cov(cov_func, ls, amp2, noise, X,
+                                           kernel), lower=True)
+        elif entry[0].shape[0] >= X.shape[0]:
+            # The leading block of a factor is the factor of the leading
+            # block of the covariance.
+            chol = entry[1][:X.shape[0],:X.shape[0]]
+        else:
+            chol = self._extend(entry[1], cov_func, ls, amp2, noise,
+                                entry[0], X[entry[0].shape[0]:])
+
+        # Keep the longest factor, which also serves its prefixes.
+        if entry is not None and entry[0].shape[0] >= X.shape[0]:
+            self.entries[key] = entry
+        elif remember or entry is not None:
+            self.entries[key] = (X.copy(), chol)
+
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+        return chol
+
+    def _cov(self, cov_func, ls, amp2, noise, X, kernel=None):
+        if kernel is None:
+            kernel = cov_func(ls, X, None)
+        else:
+            kernel = kernel()
+        return (amp2 * (kernel + 1e-6*np.eye(X.shape[0])) +
+                noise*np.eye(X.shape[0]))
+
+    def _is_prefix(self, X0, X):
+        return (X0.shape[0] > 0 and X0.shape[1] == X.shape[1] and
+                np.array_equal(X0[:X.shape[0]], X[:X0.shape[0]]))
+
+    def _extend(self, L0, cov_func, ls, amp2, noise, X0, X1):
+        # [L0 0; L10 L11] with L10 = K10 L0^-T and L11 L11^T = K11 - L10 L10^T.
+        L10 = spla.solve_triangular(L0, amp2*cov_func(ls, X0, X1),
+                                    lower=True).T
+        L11 = spla.cholesky(self._cov(cov_func, ls, amp2, noise, X1) -
+                            np.dot(L10, L10.T), lower=True)
+
+        n0, n1 = X0.shape[0], X1.shape[0]
+        L = np.zeros((n0 + n1, n0 + n1))
+        L[:n0,:n0] = L0
+        L[n0:,:n0] = L10
+        L[n0:,n0:] = L11
+        return L
+
+def weighted_cross_grad(cov_func, ls, X, cand, weights):
+    """
+    sum_i weights[i] * d cov_func(ls, X[i], cand[j]) / d cand[j] for each
+    of the candidates, an MxD array.  weights may also be NxM, with a
+    column for each candidate.  Memory is O(N*M + M*D), not O(N*M*D).
+    """
+    # The kernel gradients are with respect to X[i], and the covariance
+    # only depends on X[i] - cand[j].
+    grad_func = globals()['grad_' + cov_func.__name__]
+    return -grad_func(ls, X, cand, weights=weights)
+
+# Candidates are scored a block at a time, sized so that the temporaries
+# for a block take about this many bytes, however many candidates there
+# are.  Blocks that fit in cache are also faster than one big pass.
+EI_MEMORY = 16*2**20
+
+def block_size(memory, samples, N, S):
+    # Per candidate, the cross covariances and their solves take a few
+    # rows of N, and the predictions and EI a few rows of S fantasies,
+    # for each of the samples.
+    return max(1, int(memory // (8 * samples * (4*N + 5*S))))
+
+def in_blocks(score, cand, out, size):
+    # Fills out with score(cand), size candidates at a time.
+    for start in xrange(0, cand.shape[0], size):
+        out[start:start+size] = score(cand[start:start+size])
+    return out
+
+def expected_improvement(func_s, u):
+    # Returns EI with the normal cdf and pdf at u.  These are what
+    # scipy.stats.norm computes, without its argument checking, which
+    # costs several times as much on arrays of candidates.
+    ncdf = spsp.ndtr(u)
+    npdf = np.exp(-u**2/2.0) / SQRT_2PI
+    return func_s*(u*ncdf + npdf), ncdf, npdf
+
+class Posterior:
+    """
+    A GP with fixed hyperparameters conditioned on the observations Y at
+    inputs X, given the Cholesky factor of their covariance.  Y may have a
+    column for each fantasized outcome of the pending jobs, in which case
+    EI is averaged over the fantasies.  Everything that does not depend on
+    the candidates is worked out once, here, so that scoring a candidate
+    only costs its cross covariances with X.
+    """
+
+    def __init__(self, cov_func, ls, amp2, mean, X, chol, Y, memory=EI_MEMORY):
+        self.memory        = memory
+        self.cov_func      = cov_func
+        self.ls            = ls
+        self.amp2          = amp2
+        self.mean          = mean
+        self.X             = X
+        self.chol          = chol
+
+        Y = np.reshape(Y, (X.shape[0], -1))
+        self.alpha = spla.cho_solve((chol, True), Y - mean)
+        self.bests = np.min(Y, axis=0)
+
+        # Solving with the factor costs a copy of it, and much more than
+        # the product with its inverse when there are few candidates, as
+        # in each step of optimizing one.
+        self.chol_inv = spla.solve_triangular(chol, np.eye(X.shape[0]),
+                                              lower=True)
+
+    def ei(self, cand, out=None):
+        """Expected improvement at each of the candidates, written to out
+        if it is given."""
+        if out is None:
+            out = np.empty(cand.shape[0])
+        size = block_size(self.memory, 1, self.X.shape[0], self.alpha.shape[1])
+        return in_blocks(self._block_ei, cand, out, size)
+
+    def _block_ei(self, cand):
+        cand_cross = self.amp2 * self.cov_func(self.ls, self.X, cand)
+        ei = self._ei(cand_cross)[0]
+        return np.mean(ei, axis=1)
+
+    def grad_ei(self, cand):
+        """Expected improvement at each of the candidates, and for each
+        the direction in which the choosers descend on -EI, which is half
+        its gradient."""
+        cand = np.reshape(cand, (-1, self.X.shape[1]))
+        cand_cross = self.amp2 * self.cov_func(self.ls, self.X, cand)
+
+        ei, func_s, ncdf, npdf, beta = self._ei(cand_cross)
+
+        # Gradients of ei w.r.t. mean and variance, averaged over the
+        # fantasies through the weights of the cross covariances.
+        g_ei_m  = -ncdf
+        g_ei_s2 = 0.5*npdf / func_s
+
+        weights  = np.dot(self.alpha, g_ei_m.T) / g_ei_m.shape[1]
+        weights -= 2*np.dot(self.chol_inv.T, beta) * np.mean(g_ei_s2, axis=1)
+
+        grad_xp = -0.5*self.amp2*weighted_cross_grad(self.cov_func, self.ls,
+                                                      self.X, cand, weights)
+        return np.mean(ei, axis=1), grad_xp
+
+    def _ei(self, cand_cross):
+        beta = np.dot(self.chol_inv, cand_cross)
+
+        # Predict the marginal means and variances at candidates.
+        func_m = np.dot(cand_cross.T, self.alpha) + self.mean
+        func_v = self.amp2*(1+1e-6) - np.sum(beta**2, axis=0)
+
+        # Expected improvement
+        func_s = np.sqrt(func_v[:,np.newaxis])
+        u      = (self.bests[np.newaxis,:] - func_m) / func_s
+        ei, ncdf, npdf = expected_improvement(func_s, u)
+        return ei, func_s, ncdf, npdf, beta
+
+class PosteriorStack:
+    """
+    Posteriors with the same inputs under several hyperparameter samples,
+    stacked along a leading axis so that the kernels, solves and EI for
+    all of the samples are single NumPy calls.
+    """
+
+    def __init__(self, posteriors, memory=EI_MEMORY):
+        self.memory     = memory
+        self.posteriors = list(posteriors)
+        self.cov_func   = self.posteriors[0].cov_func
+        self.X          = self.posteriors[0].X
+
+        self.ls    = np.array([p.ls for p in self.posteriors])
+        self.amp2  = np.array([p.amp2 for p in self.posteriors])[:,np.newaxis]
+        self.mean  = np.array([p.mean for p in self.posteriors])[:,np.newaxis]
+        self.alpha = np.array([p.alpha for p in self.posteriors])
+        self.bests = np.array([p.bests for p in self.posteriors])
+
+        # With the inverted factors, the triangular solves for every batch
+        # of candidates are one stacked product.
+        self.chol_inv = np.array([p.chol_inv for p in self.posteriors])
+
+    def __len__(self):
+        return len(self.posteriors)
+
+    def __iter__(self):
+        return iter(self.posteriors)
+
+    def ei(self, cand, out=None):
+        """Expected improvement at each of the candidates (rows) under
+        each of the samples (columns), written to out if it is given."""
+        if out is None:
+            out = np.empty((cand.shape[0], len(self)))
+        return in_blocks(self._block_ei, cand, out, self._block_size())
+
+    def predict_mean(self, cand, out=None):
+        """Predictive mean at each of the candidates (rows) under each of
+        the samples (columns), averaged over the fantasies."""
+        if out is None:
+            out = np.empty((cand.shape[0], len(self)))
+        return in_blocks(self._block_mean, cand, out, self._block_size())
+
+    def _block_size(self):
+        return block_size(self.memory, len(self), self.X.shape[0],
+                          self.alpha.shape[2])
+
+    def _block_ei(self, cand):
+        cand_cross  = self.cov_func(self.ls, self.X, cand)
+        cand_cross *= self.amp2[:,:,np.newaxis]
+        beta = np.matmul(self.chol_inv, cand_cross)
+
+        # Predict the marginal means and variances at candidates.
+        func_m  = np.matmul(cand_cross.transpose(0,2,1), self.alpha)
+        func_m += self.mean[:,:,np.newaxis]
+        func_v  = self.amp2*(1+1e-6) - np.einsum('hnm,hnm->hm', beta, beta)
+
+        # Expected improvement
+        func_s = np.sqrt(func_v[:,:,np.newaxis])
+        u      = np.subtract(self.bests[:,np.newaxis,:], func_m, out=func_m)
+        u     /= func_s
+        ei     = expected_improvement(func_s, u)[0]
+        return np.mean(ei, axis=2).T
+
+    def _block_mean(self, cand):
+        cand_cross  = self.cov_func(self.ls, self.X, cand)
+        cand_cross *= self.amp2[:,:,np.newaxis]
+        func_m = np.matmul(cand_cross.transpose(0,2,1), self.alpha)
+        return (np.mean(func_m, axis=2) + self.mean).T
+
+def condition(cov_func, hyper, comp, vals, pend, pending_samples,
+              cholesky=None, memory=EI_MEMORY):
+    """
+    The Posterior of a GP with hyperparameters hyper = (mean, noise, amp2,
+    ls) given the complete jobs and, if there are pending ones,
+    pending_samples fantasies of their outcomes drawn with numpy's global
+    random state.  cholesky(X) factors the observation covariance of X;
+    by default it is computed from scratch.  memory bounds the temporaries
+    of scoring candidates, in bytes.
+    """
+    mean, noise, amp2, ls = hyper
+
+    if cholesky is None:
+        def cholesky(X):
+            cov = (amp2 * (cov_func(ls, X, None) + 1e-6*np.eye(X.shape[0])) +
+                   noise*np.eye(X.shape[0]))
+            return spla.cholesky(cov, lower=True)
+
+    if pend.shape[0] == 0:
+        # If there are no pending, don't do anything fancy.
+        return Posterior(cov_func, ls, amp2, mean, comp, cholesky(comp), vals,
+                         memory)
+
+    # If there are pending experiments, fantasize their outcomes.
+
+    # Create a composite vector of complete and pending.
+    comp_pend = np.concatenate((comp, pend))
+
+    # Compute the Cholesky decomposition.
+    comp_pend_chol = cholesky(comp_pend)
+
+    # Compute submatrices.
+    pend_cross = amp2 * cov_func(ls, comp, pend)
+    pend_kappa = amp2 * (cov_func(ls, pend, None) + 1e-6*np.eye(pend.shape[0]))
+
+    # Use the sub-Cholesky.
+    obsv_chol = comp_pend_chol[:comp.shape[0],:comp.shape[0]]
+
+    # Solve the linear systems.
+    alpha  = spla.cho_solve((obsv_chol, True), vals - mean)
+    beta   = spla.cho_solve((obsv_chol, True), pend_cross)
+
+    # Finding predictive means and variances.
+    pend_m = np.dot(pend_cross.T, alpha) + mean
+    pend_K = pend_kappa - np.dot(pend_cross.T, beta)
+
+    # Take the Cholesky of the predictive covariance.
+    pend_chol = spla.cholesky(pend_K, lower=True)
+
+    # Make predictions.
+    pend_fant = (np.dot(pend_chol, np.random.randn(pend.shape[0], pending_samples))
+                 + pend_m[:,None])
+
+    # Include the fantasies.
+    fant_vals = np.concatenate((np.tile(vals[:,np.newaxis],
+                                        (1,pending_samples)), pend_fant))
+
+    return Posterior(cov_func, ls, amp2, mean, comp_pend, comp_pend_chol,
+                     fant_vals, memory)
+
 class GP:
     def __init__(self, covar="Matern52", mcmc_iters=10, noiseless=False):
         self.cov_func        = globals()[covar]
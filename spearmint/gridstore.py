@@ -0,0 +1,601 @@
+##
+# Copyright (C) 2012 Jasper Snoek, Hugo Larochelle and Ryan P. Adams
+#
+# This code is written for research and educational purposes only to
+# supplement the paper entitled
+# "Practical Bayesian Optimization of Machine Learning Algorithms"
+# by Snoek, Larochelle and Adams
+# Advances in Neural Information Processing Systems, 2012
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+gridstore.py contains the storage backends used to persist an
+ExperimentGrid.  A store is handed the grid after every state transition
+and decides how much of it has to reach the disk.
+"""
+import os
+import tempfile
+import cPickle
+import sqlite3
+
+import numpy as np
+
+from helpers import check_dir
+
+import logging
+
+EXPERIMENT_GRID_FILE    = 'expt-grid.pkl'
+EXPERIMENT_JOURNAL_FILE = 'expt-grid.journal'
+EXPERIMENT_COLUMNS_DIR  = 'expt-grid.cols'
+EXPERIMENT_DB_FILE      = 'expt-grid.db'
+# Path of a database outside the experiment directory holding its grid.
+EXPERIMENT_DB_LINK      = 'expt-grid.db-link'
+
+# Per-job columns kept alongside the grid, with their dtype and the value
+# a fresh candidate starts with (status 0 is the candidate state).  A job's
+# sobol_id is the index of its point in the Sobol sequence, or -1 for a
+# point the chooser made up.
+JOB_COLUMNS = [('status',   int,   0),
+               ('values',   float, np.nan),
+               ('durs',     float, np.nan),
+               ('proc_ids', int,   0),
+               ('cpu_times', float, np.nan),
+               ('peak_rss', float, np.nan),
+               ('sobol_ids', int, -1)]
+
+class GridStore(object):
+    """
+    Interface shared by all the grid storage backends.  Backends that keep
+    the columns on disk may replace the arrays of the grid they are handed
+    with views of their own.
+    """
+
+    def __init__(self, expt_dir):
+        self.expt_dir = expt_dir
+
+    def exists(self):
+        '''True if a grid has already been saved for this experiment.'''
+        raise NotImplementedError()
+
+    def load(self):
+        '''Return a dict with 'vmap', 'grid' and one array per job column.'''
+        raise NotImplementedError()
+
+    def save(self, expt_grid):
+        '''Write out the complete state of the grid.'''
+        raise NotImplementedError()
+
+    def save_job(self, expt_grid, id):
+        '''Persist the job columns of row id after a state transition.'''
+        self.save(expt_grid)
+
+    def add_job(self, expt_grid, id):
+        '''Persist row id, which has just been appended to the grid.'''
+        self.save(expt_grid)
+
+    def grow(self, expt_grid, capacity):
+        '''
+        Return a dict of buffers with room for capacity rows, holding the
+        grid and the job columns of expt_grid.
+        '''
+        buffers = {}
+        for name in ['grid'] + [c[0] for c in JOB_COLUMNS]:
+            column = getattr(expt_grid, name)
+            buffer = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+            buffer[:column.shape[0]] = column
+            buffers[name] = buffer
+        return buffers
+
+    def close(self, expt_grid):
+        '''Called when the grid goes away.'''
+        pass
+
+    def job_ids(self, expt_grid, states):
+        '''Indices of the jobs in any of the given states, in order.'''
+        mask = expt_grid.status == states[0]
+        for state in states[1:]:
+            mask |= expt_grid.status == state
+        return np.nonzero(mask)[0]
+
+    def best_job(self, expt_grid):
+        '''The smallest finite value and the first job that reached it.'''
+        finite = expt_grid.values[np.isfinite(expt_grid.values)]
+        if len(finite) > 0:
+            cur_min = np.min(finite)
+            index   = np.nonzero(expt_grid.values==cur_min)[0][0]
+            return cur_min, index
+        else:
+            return np.nan, -1
+
+class PickleGridStore(GridStore):
+    """
+    The whole grid is pickled to a single file, which is atomically
+    replaced every time anything changes.
+    """
+
+    def __init__(self, expt_dir):
+        super(PickleGridStore, self).__init__(expt_dir)
+        self.jobs_pkl     = os.path.join(expt_dir, EXPERIMENT_GRID_FILE)
+        self.journal_file = os.path.join(expt_dir, EXPERIMENT_JOURNAL_FILE)
+
+    def exists(self):
+        return os.path.exists(self.jobs_pkl)
+
+    def load(self):
+        fh   = open(self.jobs_pkl, 'rb')
+        jobs = cPickle.load(fh)
+        fh.close()
+
+        # Grids written before a column existed get its default.
+        num_jobs = jobs['grid'].shape[0]
+        for name, dtype, fill in JOB_COLUMNS:
+            if name not in jobs:
+                jobs[name] = np.zeros(num_jobs, dtype=dtype) + fill
+
+        # A journal left behind by a JournalGridStore holds the
+        # transitions that happened after the snapshot was taken.
+        if os.path.exists(self.journal_file):
+            self._replay_journal(jobs)
+
+        return jobs
+
+    def save(self, expt_grid):
+        jobs = { 'vmap' : expt_grid.vmap,
+                 'grid' : expt_grid.grid }
+        for name, dtype, fill in JOB_COLUMNS:
+            jobs[name] = getattr(expt_grid, name)
+
+        # Write everything to a temporary file in the experiment directory
+        # first, so that the rename below is atomic.
+        fh = tempfile.NamedTemporaryFile(mode='wb', dir=self.expt_dir,
+                                         prefix='.expt-grid', delete=False)
+        cPickle.dump(jobs, fh, protocol=-1)
+        fh.close()
+        os.rename(fh.name, self.jobs_pkl)
+
+        # The snapshot now includes everything that was journaled.
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+
+    def close(self, expt_grid):
+        self.save(expt_grid)
+
+    def _replay_journal(self, jobs):
+        fh     = open(self.journal_file, 'rb')
+        good   = 0
+        replay = 0
+        while True:
+            try:
+                record = cPickle.load(fh)
+            except EOFError:
+                break
+            except Exception:
+                # A crash in the middle of an append leaves a torn record
+                # at the end of the journal.
+                logging.warning("Ignoring torn record at offset %d of %s",
+                                good, self.journal_file)
+                break
+
+            op, id, row = record[0], record[1], record[-1]
+            if op == 'add':
+                num_jobs = jobs['grid'].shape[0]
+                if id == num_jobs:
+                    jobs['grid'] = np.vstack((jobs['grid'], record[2]))
+                    for name, dtype, fill in JOB_COLUMNS:
+                        jobs[name] = np.append(jobs[name],
+                                               np.zeros(1, dtype=dtype) + fill)
+                elif id < num_jobs:
+                    jobs['grid'][id,:] = record[2]
+
+            # Records hold the full row, so replaying one that is already
+            # part of the snapshot is harmless.
+            if id < jobs['grid'].shape[0]:
+                for name, value in row.iteritems():
+                    jobs[name][id] = value
+
+            good    = fh.tell()
+            replay += 1
+        fh.close()
+
+        # Drop the torn tail so that later appends stay readable.
+        if good < os.path.getsize(self.journal_file):
+            fh = open(self.journal_file, 'r+b')
+            fh.truncate(good)
+            fh.close()
+
+        logging.info("Replayed %d journaled grid transitions", replay)
+        return replay
+
+class JournalGridStore(PickleGridStore):
+    """
+    Keeps a pickled snapshot of the grid plus an append-only journal of
+    the state transitions since that snapshot.  A transition costs one
+    small append; every compact_every records the journal is folded back
+    into a fresh snapshot.  Only one process is expected to write to the
+    grid at a time.
+    """
+
+    def __init__(self, expt_dir, compact_every=1000):
+        super(JournalGridStore, self).__init__(expt_dir)
+        self.compact_every = int(compact_every)
+        self.journal       = None
+        self.records       = 0
+
+    def load(self):
+        self.records = 0
+        return super(JournalGridStore, self).load()
+
+    def _replay_journal(self, jobs):
+        # New records go after the ones already in the journal, so those
+        # count towards the next compaction too.
+        self.records = super(JournalGridStore, self)._replay_journal(jobs)
+        return self.records
+
+    def save(self, expt_grid):
+        self._close_journal()
+        super(JournalGridStore, self).save(expt_grid)
+        self.records = 0
+
+    def save_job(self, expt_grid, id):
+        self._append(expt_grid, ('job', id, self._row(expt_grid, id)))
+
+    def add_job(self, expt_grid, id):
+        self._append(expt_grid, ('add', id, expt_grid.grid[id,:],
+                                 self._row(expt_grid, id)))
+
+    def close(self, expt_grid):
+        self._close_journal()
+
+    def _row(self, expt_grid, id):
+        return dict((name, getattr(expt_grid, name)[id])
+                    for name, dtype, fill in JOB_COLUMNS)
+
+    def _append(self, expt_grid, record):
+        if self.records >= self.compact_every:
+            self.save(expt_grid)
+
+        if self.journal is None:
+            self.journal = open(self.journal_file, 'ab')
+
+        # Flush each record so that it survives the controller dying.
+        cPickle.dump(record, self.journal, protocol=-1)
+        self.journal.flush()
+        self.records += 1
+
+    def _close_journal(self):
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+class MemmapGridStore(GridStore):
+    """
+    Every column of the grid lives in its own fixed-layout binary file
+    that is opened with np.memmap.  Opening a grid reads nothing but a
+    small metadata pickle, and a state transition only dirties the page
+    holding that job.  Other processes (status pages, workers) can open
+    the same files with mode='r' and share the pages with the controller.
+    The files are grown by doubling and count.bin holds the number of rows
+    in use.
+    """
+
+    # On-disk layout of each column type.
+    dtypes = { int : '<i8', float : '<f8' }
+
+    def __init__(self, expt_dir, mode='r+'):
+        super(MemmapGridStore, self).__init__(expt_dir)
+        self.cols_dir  = os.path.join(expt_dir, EXPERIMENT_COLUMNS_DIR)
+        self.meta_file = os.path.join(self.cols_dir, 'meta.pkl')
+        self.mode      = mode
+        self.count     = None
+
+    def exists(self):
+        return os.path.exists(self.meta_file)
+
+    def load(self):
+        fh   = open(self.meta_file, 'rb')
+        meta = cPickle.load(fh)
+        fh.close()
+
+        num_jobs = self._rows('grid', float, meta['dims'])
+        if os.path.exists(self._path('count')):
+            num_jobs = min(num_jobs, int(self._map('count', int, 1)[0]))
+
+        for name, dtype, fill in JOB_COLUMNS:
+            path = self._path(name)
+            if not os.path.exists(path):
+                # Columns introduced after this grid was created.
+                (np.zeros(num_jobs, dtype=self.dtypes[dtype]) + fill).tofile(path)
+            num_jobs = min(num_jobs, self._rows(name, dtype))
+
+        jobs = { 'vmap' : meta['vmap'],
+                 'grid' : self._map('grid', float, num_jobs, meta['dims']) }
+        for name, dtype, fill in JOB_COLUMNS:
+            jobs[name] = self._map(name, dtype, num_jobs)
+        return jobs
+
+    def save(self, expt_grid):
+        check_dir(self.cols_dir)
+
+        self._write(self._path('grid'),
+                    np.asarray(expt_grid.grid, dtype=self.dtypes[float]))
+        for name, dtype, fill in JOB_COLUMNS:
+            self._write(self._path(name),
+                        np.asarray(getattr(expt_grid, name),
+                                   dtype=self.dtypes[dtype]))
+        self._write(self._path('count'),
+                    np.array([expt_grid.num_jobs], dtype=self.dtypes[int]))
+        self.count = None
+
+        # The metadata goes last: its presence marks a complete grid.
+        fh = tempfile.NamedTemporaryFile(mode='wb', dir=self.cols_dir,
+                                         delete=False)
+        cPickle.dump({ 'vmap' : expt_grid.vmap,
+                       'dims' : expt_grid.grid.shape[1] }, fh, protocol=-1)
+        fh.close()
+        os.rename(fh.name, self.meta_file)
+
+        self._attach(expt_grid, expt_grid.grid.shape[0])
+
+    def save_job(self, expt_grid, id):
+        # The transition was written straight into the mapped pages.
+        pass
+
+    def add_job(self, expt_grid, id):
+        # The row itself went straight into the mapped buffers; counting
+        # it last means a crash never exposes a half written row.
+        if self.count is None:
+            self.count = self._map('count', int, 1)
+        self.count[0] = id+1
+
+    def grow(self, expt_grid, capacity):
+        dims    = expt_grid.grid.shape[1]
+        buffers = {}
+        for name, dtype, size in ([('grid', float, dims)] +
+                                  [(c[0], c[1], 1) for c in JOB_COLUMNS]):
+            row_bytes = size * np.dtype(self.dtypes[dtype]).itemsize
+            fh = open(self._path(name), 'r+b')
+            fh.seek(0, os.SEEK_END)
+            if fh.tell() < capacity * row_bytes:
+                fh.truncate(capacity * row_bytes)
+            fh.close()
+            buffers[name] = self._map(name, dtype, capacity,
+                                      dims if name == 'grid' else None)
+        return buffers
+
+    def close(self, expt_grid):
+        for column in expt_grid.buffers.values() + [self.count]:
+            if isinstance(column, np.memmap) and self.mode != 'r':
+                column.flush()
+
+    def _path(self, name):
+        return os.path.join(self.cols_dir, name + '.bin')
+
+    def _rows(self, name, dtype, dims=1):
+        row_bytes = dims * np.dtype(self.dtypes[dtype]).itemsize
+        return os.path.getsize(self._path(name)) // row_bytes
+
+    def _map(self, name, dtype, num_jobs, dims=None):
+        shape = (num_jobs,) if dims is None else (num_jobs, dims)
+        if num_jobs == 0:
+            return np.zeros(shape, dtype=self.dtypes[dtype])
+        return np.memmap(self._path(name), dtype=self.dtypes[dtype],
+                         mode=self.mode, shape=shape)
+
+    def _attach(self, expt_grid, num_jobs):
+        dims = expt_grid.grid.shape[1]
+        expt_grid.grid = self._map('grid', float, num_jobs, dims)
+        for name, dtype, fill in JOB_COLUMNS:
+            setattr(expt_grid, name, self._map(name, dtype, num_jobs))
+
+    def _write(self, path, data):
+        fh = tempfile.NamedTemporaryFile(mode='wb', dir=self.cols_dir,
+                                         delete=False)
+        data.tofile(fh)
+        fh.close()
+        os.rename(fh.name, path)
+
+class SqliteGridStore(GridStore):
+    """
+    Keeps the grid in an SQLite database, one row per job, with indexes
+    on the status and the value of the jobs so that the per-state index
+    sets and the best job so far come from indexed queries.  Several
+    experiments can share one database file (db_file), each under its own
+    name; the database runs in WAL mode so that readers do not block the
+    controller.  A database elsewhere is recorded in the experiment
+    directory, so that whatever opens the grid without being told where
+    it is still finds it.
+    """
+
+    sql_types = { int : 'INTEGER', float : 'REAL' }
+
+    def __init__(self, expt_dir, db_file=None, name=None):
+        super(SqliteGridStore, self).__init__(expt_dir)
+        if db_file is None:
+            db_file = os.path.join(expt_dir, EXPERIMENT_DB_FILE)
+        if name is None:
+            name = os.path.realpath(expt_dir)
+        self.db_file = db_file
+        self.name    = name
+        self.db      = None
+        self.columns = ', '.join('"%s"' % c[0] for c in JOB_COLUMNS)
+
+    def exists(self):
+        if not os.path.exists(self.db_file):
+            return False
+        row = self._connect().execute(
+            'SELECT COUNT(*) FROM experiments WHERE name = ?',
+            (self.name,)).fetchone()
+        return row[0] > 0
+
+    def load(self):
+        self._link()
+        db = self._connect()
+        dims, vmap = db.execute(
+            'SELECT dims, vmap FROM experiments WHERE name = ?',
+            (self.name,)).fetchone()
+        rows = db.execute('SELECT point, %s FROM jobs WHERE expt = ? '
+                          'ORDER BY id' % self.columns,
+                          (self.name,)).fetchall()
+
+        jobs = { 'vmap' : cPickle.loads(str(vmap)),
+                 'grid' : np.frombuffer(''.join(str(r[0]) for r in rows),
+                                        dtype='<f8').reshape(-1, dims).copy() }
+        for ii, (name, dtype, fill) in enumerate(JOB_COLUMNS):
+            # SQLite stores NaN as NULL.
+            jobs[name] = np.array([fill if r[ii+1] is None else r[ii+1]
+                                   for r in rows], dtype=dtype)
+        return jobs
+
+    def save(self, expt_grid):
+        self._link()
+        db = self._connect()
+        with db:
+            db.execute('INSERT OR REPLACE INTO experiments (name, dims, vmap) '
+                       'VALUES (?, ?, ?)',
+                       (self.name, expt_grid.grid.shape[1],
+                        buffer(cPickle.dumps(expt_grid.vmap, protocol=-1))))
+            db.execute('DELETE FROM jobs WHERE expt = ?', (self.name,))
+            db.executemany(self._insert(),
+                           (self._row(expt_grid, id)
+                            for id in xrange(expt_grid.num_jobs)))
+
+    def save_job(self, expt_grid, id):
+        db = self._connect()
+        with db:
+            db.execute('UPDATE jobs SET %s WHERE expt = ? AND id = ?' %
+                       ', '.join('"%s" = ?' % c[0] for c in JOB_COLUMNS),
+                       self._row(expt_grid, id)[3:] + (self.name, id))
+
+    def add_job(self, expt_grid, id):
+        db = self._connect()
+        with db:
+            db.execute(self._insert(), self._row(expt_grid, id))
+
+    def close(self, expt_grid):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def job_ids(self, expt_grid, states):
+        rows = self._connect().execute(
+            'SELECT id FROM jobs WHERE expt = ? AND "status" IN (%s) '
+            'ORDER BY id' % ', '.join('?' * len(states)),
+            (self.name,) + tuple(states)).fetchall()
+        return np.array([r[0] for r in rows], dtype=int)
+
+    def best_job(self, expt_grid):
+        # 9e999 is infinity to SQLite, NULLs (NaNs) fail both tests.
+        row = self._connect().execute(
+            'SELECT "values", id FROM jobs WHERE expt = ? '
+            'AND "values" > -9e999 AND "values" < 9e999 '
+            'ORDER BY "values", id LIMIT 1', (self.name,)).fetchone()
+        if row is None:
+            return np.nan, -1
+        return row[0], row[1]
+
+    def _link(self):
+        db_file = os.path.realpath(self.db_file)
+        if (db_file == os.path.realpath(os.path.join(self.expt_dir,
+                                                     EXPERIMENT_DB_FILE)) or
+            db_file == linked_db(self.expt_dir)):
+            return
+
+        fh = tempfile.NamedTemporaryFile(mode='w', dir=self.expt_dir,
+                                         prefix='.expt-grid', delete=False)
+        fh.write(db_file + '\n')
+        fh.close()
+        os.rename(fh.name, os.path.join(self.expt_dir, EXPERIMENT_DB_LINK))
+
+    def _connect(self):
+        if self.db is not None:
+            return self.db
+
+        self.db = sqlite3.connect(self.db_file)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        with self.db:
+            self.db.execute('CREATE TABLE IF NOT EXISTS experiments '
+                            '(name TEXT PRIMARY KEY, dims INTEGER, vmap BLOB)')
+            self.db.execute('CREATE TABLE IF NOT EXISTS jobs '
+                            '(expt TEXT NOT NULL, id INTEGER NOT NULL, '
+                            'point BLOB, PRIMARY KEY (expt, id))')
+
+            # Columns introduced after this database was created.
+            known = set(r[1] for r in self.db.execute('PRAGMA table_info(jobs)'))
+            for name, dtype, fill in JOB_COLUMNS:
+                if name not in known:
+                    default = 'NULL' if np.isnan(fill) else repr(fill)
+                    self.db.execute('ALTER TABLE jobs ADD COLUMN "%s" %s '
+                                    'DEFAULT %s' % (name, self.sql_types[dtype],
+                                                    default))
+
+            self.db.execute('CREATE INDEX IF NOT EXISTS jobs_status '
+                            'ON jobs (expt, "status", id)')
+            self.db.execute('CREATE INDEX IF NOT EXISTS jobs_values '
+                            'ON jobs (expt, "values", id)')
+        return self.db
+
+    def _insert(self):
+        return ('INSERT OR REPLACE INTO jobs (expt, id, point, %s) '
+                'VALUES (?, ?, ?, %s)' % (self.columns,
+                                          ', '.join('?' * len(JOB_COLUMNS))))
+
+    def _row(self, expt_grid, id):
+        point = np.asarray(expt_grid.grid[id,:], dtype='<f8')
+        return ((self.name, int(id), buffer(point.tostring())) +
+                tuple(getattr(expt_grid, c[0])[id].item() for c in JOB_COLUMNS))
+
+GRID_STORES = { 'pickle'  : PickleGridStore,
+                'journal' : JournalGridStore,
+                'memmap'  : MemmapGridStore,
+                'sqlite'  : SqliteGridStore }
+
+def linked_db(expt_dir):
+    '''
+    The database holding the grid in expt_dir that SqliteGridStore
+    recorded there, or None if the grid is kept elsewhere.
+    '''
+    link = os.path.join(expt_dir, EXPERIMENT_DB_LINK)
+    if not os.path.exists(link):
+        return None
+    fh = open(link, 'r')
+    db_file = fh.read().strip()
+    fh.close()
+    return db_file
+
+def open_grid_store(expt_dir, store=None):
+    '''
+    Return the store used for the grid in expt_dir.  store is either a
+    GridStore instance, the name of one of GRID_STORES or None to use
+    whatever format the grid was saved in (journal for a new grid).
+    '''
+    if isinstance(store, GridStore):
+        return store
+
+    db_file = linked_db(expt_dir)
+    if store is None:
+        if MemmapGridStore(expt_dir).exists():
+            store = 'memmap'
+        elif (db_file is not None or
+              os.path.exists(os.path.join(expt_dir, EXPERIMENT_DB_FILE))):
+            store = 'sqlite'
+        else:
+            store = 'journal'
+
+    if store not in GRID_STORES:
+        raise Exception("Unknown grid store '%s'." % store)
+
+    if store == 'sqlite':
+        return SqliteGridStore(expt_dir, db_file)
+    return GRID_STORES[store](expt_dir)
@@ -30,9 +30,11 @@ try: import simplejson as json
 except ImportError: import json
 
 
+from spearmint                 import util
 from spearmint.ExperimentGrid  import *
 from spearmint.helpers         import *
-from spearmint.runner          import PythonRunner
+from spearmint.runner          import PythonRunner, PoolRunner, ThreadRunner, \
+                                      IsolatedRunner, MemoCache
 
 
 # There are two things going on here.  There are "experiments", which are
@@ -62,12 +64,41 @@ def parse_args():
     parser.add_option("--method-args", dest="chooser_args",
                       help="Arguments to pass to chooser module.",
                       type="string", default="")
+    parser.add_option("--max-concurrent", dest="max_concurrent",
+                      help="Number of jobs to run at the same time.",
+                      type="int", default=1)
+    parser.add_option("--pipeline", dest="pipeline", action="store_true",
+                      help="Choose the next job while the running ones finish.")
+    parser.add_option("--memo-size", dest="memo_size",
+                      help="Number of results remembered across runs, so that "
+                           "a configuration is not run twice. 0 only remembers "
+                           "results within this run.",
+                      type="int", default=10000)
+    parser.add_option("--isolate", dest="isolate", action="store_true",
+                      help="Run jobs in separate worker processes.")
+    parser.add_option("--job-timeout", dest="job_timeout",
+                      help="Seconds after which a job is killed (implies --isolate).",
+                      type="float", default=None)
+    parser.add_option("--job-memory", dest="job_memory",
+                      help="Memory limit of a job, in MB (implies --isolate).",
+                      type="int", default=None)
     parser.add_option("--grid-size", dest="grid_size",
                       help="Number of experiments in initial grid.",
                       type="int", default=20000)
     parser.add_option("--grid-seed", dest="grid_seed",
                       help="The seed used to initialize initial grid.",
                       type="int", default=1)
+    parser.add_option("--grid-stream", dest="grid_stream", action="store_true",
+                      help="Generate the grid's points as they are needed rather "
+                           "than up front. Give it, with the same --grid-size and "
+                           "--grid-seed, whenever the experiment is resumed.")
+    parser.add_option("--grid-store", dest="grid_store",
+                      help="How the grid is persisted [journal, pickle, memmap, sqlite]. "
+                           "Defaults to the format of an existing grid.",
+                      type="string", default=None)
+    parser.add_option("--grid-db", dest="grid_db",
+                      help="SQLite database shared by several experiments.",
+                      type="string", default=None)
     parser.add_option("-v", "--verbose", action="store_true",
                       help="Print verbose debug output.")
 
@@ -108,15 +139,27 @@ def main():
 
 def optimize(experiment, objective_function, working_directory,
         chooser, options):
+    grid_store = options.grid_store
+    if options.grid_db is not None:
+        grid_store = SqliteGridStore(working_directory, options.grid_db)
+
     # Loop until we run out of jobs.
-    for current_best, best_job, best_params, _next in \
+    for current_best, best_job, best_params, _picked in \
             explore_space_of_candidates(experiment,
                     objective_function,
                     working_directory,
                     chooser,
                     grid_size=options.grid_size,
                     grid_seed=options.grid_seed,
-                    max_finished_jobs=options.max_finished_jobs):
+                    grid_store=grid_store,
+                    grid_stream=options.grid_stream,
+                    max_finished_jobs=options.max_finished_jobs,
+                    max_concurrent=options.max_concurrent,
+                    pipeline=options.pipeline,
+                    isolate=options.isolate,
+                    job_timeout=options.job_timeout,
+                    job_memory=options.job_memory,
+                    memo_size=options.memo_size):
         # This is polling frequency. A higher frequency means that the algorithm
         # picks up results more quickly after they finish, but also significantly
         # increases overhead.
@@ -127,64 +170,152 @@ def explore_space_of_candidates(experiment, objective_function,
         working_directory, chooser,
         grid_size=1000,
         grid_seed=1,
-        max_finished_jobs=100):
-   
+        grid_store=None,
+        grid_stream=False,
+        max_finished_jobs=100,
+        max_concurrent=1,
+        pipeline=False,
+        isolate=False,
+        job_timeout=None,
+        job_memory=None,
+        memo_size=0):
+
+    memoizer = None
+    if memo_size > 0:
+        memoizer = MemoCache(working_directory, memo_size)
+
+    # Start the workers before the grid is opened, so that they don't
+    # inherit its files, and the chooser's before the runner's threads.
+    # When pipelining a single job, run it in a thread so that it still
+    # runs in this process, as it would without.
+    if hasattr(chooser, 'start'):
+        chooser.start()
+    if isolate or job_timeout is not None or job_memory is not None:
+        memory_limit = None
+        if job_memory is not None:
+            memory_limit = job_memory * 1024 * 1024
+        runner = IsolatedRunner(max_concurrent, job_timeout, memory_limit,
+                                memoizer)
+    elif max_concurrent > 1:
+        runner = PoolRunner(max_concurrent, memoizer)
+    elif pipeline:
+        runner = ThreadRunner(memoizer=memoizer)
+    else:
+        runner = PythonRunner(memoizer)
+
     # Build the experiment grid.
     expt_grid = ExperimentGrid(working_directory,
-                               experiment.variables, grid_size, grid_seed)
+                               experiment.variables, grid_size, grid_seed,
+                               store=grid_store, stream=grid_stream)
 
     next_jobid = 0
-    run_python_job = PythonRunner()
-
-    while next_jobid < max_finished_jobs:
-        best_val, best_job = expt_grid.get_best()
- 
-        # Gets you everything - NaN for unknown values & durations.
-        grid, values, durations = expt_grid.get_grid()
-
-
-        # Returns lists of indices.
-        candidates = expt_grid.get_candidates()
-        pending    = expt_grid.get_pending()
-        complete   = expt_grid.get_complete()
-
-        n_candidates = candidates.shape[0]
-        n_pending    = pending.shape[0]
-        n_complete   = complete.shape[0]
-        logging.info("%d candidates   %d pending   %d complete", n_candidates, 
-                n_pending, n_complete)
-
-        if n_candidates == 0:
-            logging.info("There are no candidates left.  Exiting.")
-            return
-
-        # Ask the chooser to pick the next candidate
-        logging.info("Choosing next candidate... ")
-        job_id = chooser.next(grid, values, durations, candidates, pending, complete)
-
-        yield best_val, best_job, expt_grid.get_params(best_job), job_id
-
-        # If the job_id is a tuple, then the chooser picked a new job.
-        # We have to add this to our grid
-        if isinstance(job_id, tuple):
-            (job_id, candidate) = job_id
-            job_id = expt_grid.add_to_grid(candidate)
-
-        logging.info("selected job %d from the grid", job_id)
-
-        expt_grid.set_submitted(job_id, next_jobid)
-        expt_grid.set_running(job_id)
-
-        start_t = time.time()
-        result, memoized = run_python_job(job_id, objective_function,
-                expt_grid.get_params(job_id), working_directory)
-        duration = time.time() - start_t
-        expt_grid.set_complete(job_id, result, duration)
-
-        next_jobid += 1
-
-        if memoized:
-            max_finished_jobs += 1
+    queued     = []
+
+    try:
+        while True:
+            # Record the jobs that have finished.  Wait for one if all the
+            # slots are taken or there is nothing else to submit.  When
+            # pipelining, only wait once the next job has been chosen.
+            full  = runner.running >= runner.max_concurrent
+            block = (next_jobid >= max_finished_jobs or
+                     (full and (len(queued) > 0 or not pipeline)) or
+                     expt_grid.get_candidates().shape[0] == 0)
+            for done_id, result, duration, usage in runner.collect(block):
+                if result is None:
+                    logging.info("job %d is broken", done_id)
+                    expt_grid.set_broken(done_id)
+                else:
+                    expt_grid.set_complete(done_id, result, duration, **usage)
+
+            if next_jobid >= max_finished_jobs:
+                if runner.running == 0:
+                    return
+                continue
+
+            if len(queued) == 0:
+                best_val, best_job = expt_grid.get_best()
+
+                # Gets you everything - NaN for unknown values & durations.
+                grid, values, durations = expt_grid.get_grid()
+
+                # Returns lists of indices.
+                candidates = expt_grid.get_candidates()
+                pending    = expt_grid.get_pending()
+                complete   = expt_grid.get_complete()
+
+                n_candidates = candidates.shape[0]
+                n_pending    = pending.shape[0]
+                n_complete   = complete.shape[0]
+                logging.info("%d candidates   %d pending   %d complete", n_candidates,
+                        n_pending, n_complete)
+
+                if n_candidates == 0:
+                    if runner.running == 0:
+                        logging.info("There are no candidates left.  Exiting.")
+                        return
+                    continue
+
+                # Ask the chooser to pick a candidate for each free slot,
+                # or just the next one when pipelining.  Jobs that are
+                # still running are pending, so the chooser accounts for them.
+                n_jobs = min(runner.max_concurrent - runner.running,
+                             max_finished_jobs - next_jobid, n_candidates)
+                n_jobs = max(n_jobs, 1)
+                logging.info("Choosing next %d candidate(s)... ", n_jobs)
+                if hasattr(chooser, 'next_batch'):
+                    jobs = chooser.next_batch(n_jobs, grid, values, durations,
+                                              candidates, pending, complete)
+                else:
+                    jobs = util.next_batch(chooser, n_jobs, grid, values,
+                                           durations, candidates, pending,
+                                           complete)
+
+                best_params = None
+                if best_job >= 0:
+                    best_params = expt_grid.get_params(best_job)
+
+                # One progress report per round of choosing, along with
+                # everything that was picked in it.
+                yield best_val, best_job, best_params, jobs
+
+                # Streamed candidates are numbered from the end of the grid,
+                # so they are all added before anything moves it.
+                added = iter(expt_grid.add_candidates(
+                    [job_id for job_id in jobs if not isinstance(job_id, tuple)]))
+                for job_id in jobs:
+                    # If the job_id is a tuple, then the chooser picked a new job.
+                    # We have to add this to our grid
+                    if isinstance(job_id, tuple):
+                        (job_id, candidate) = job_id
+                        job_id = expt_grid.add_to_grid(candidate)
+                    else:
+                        job_id = next(added)
+
+                    logging.info("selected job %d from the grid", job_id)
+                    queued.append(job_id)
+
+            # Hold on to the jobs until a slot frees up.
+            if runner.running >= runner.max_concurrent:
+                continue
+
+            # The job stays pending, so that the chooser takes it into
+            # account, until the runner hands back its result.
+            job_id = queued.pop(0)
+            expt_grid.set_submitted(job_id, next_jobid)
+            expt_grid.set_running(job_id)
+
+            memoized = runner.submit(job_id, objective_function,
+                    expt_grid.get_params(job_id), working_directory)
+
+            next_jobid += 1
+
+            if memoized:
+                max_finished_jobs += 1
+
+    finally:
+        runner.close()
+        if hasattr(chooser, 'close'):
+            chooser.close()
 
 
 def check_experiment_dirs(working_directory):
@@ -0,0 +1,150 @@
+##
+# Copyright (C) 2012 Jasper Snoek, Hugo Larochelle and Ryan P. Adams
+#
+# This code is written for research and educational purposes only to
+# supplement the paper entitled
+# "Practical Bayesian Optimization of Machine Learning Algorithms"
+# by Snoek, Larochelle and Adams
+# Advances in Neural Information Processing Systems, 2012
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+multistart.py minimizes an acquisition function with L-BFGS-B from many
+starting points.
+
+The starts tend to fall into the same few basins, so they are run in
+rounds, of as many as run at once, each of which knows the paths taken
+of the searches that converged in the rounds before it and the best
+value found so far.  A search that comes within radius of a known path
+is stopped, as it would follow it to the same optimum, and so is one
+whose value stays far from the best.
+"""
+import numpy          as np
+import scipy.optimize as spo
+
+class _Stop(Exception):
+    pass
+
+def local_search(func, bounds, args, start, known=None, radius=0.0,
+                 best=0.0, abandon=0.0, patience=3):
+    """
+    Runs L-BFGS-B on func(x, *args), which returns a non-positive value
+    and its gradient, from start.  The search stops early once an
+    iterate is within radius of a row of known, or, after patience
+    iterations, if its value is not even abandon times best.  Returns
+    the point reached, its value, the iterates, the evaluations used and
+    why it stopped: 'converged', 'duplicate' or 'abandoned'.
+    """
+    last  = [None, None]
+    path  = []
+    evals = [0]
+
+    def counted(x, *args):
+        evals[0] += 1
+        value, grad = func(x, *args)
+        last[:] = [x.copy(), value]
+        return value, grad
+
+    def callback(xk):
+        path.append(xk.copy())
+        if (known is not None and known.shape[0] > 0 and
+            np.min(np.sum((known - xk)**2, axis=1)) < radius**2):
+            raise _Stop('duplicate')
+        if (len(path) >= patience and best < 0 and
+            np.array_equal(last[0], xk) and last[1] > abandon*best):
+            raise _Stop('abandoned')
+
+    try:
+        x, f, d = spo.fmin_l_bfgs_b(counted,
+                                    np.asarray(start, dtype=float).flatten(),
+                                    args=args, bounds=bounds, disp=0,
+                                    callback=callback)
+        status  = 'converged'
+    except _Stop, e:
+        status = str(e)
+        x      = path[-1]
+        f      = last[1] if np.array_equal(last[0], x) else func(x, *args)[0]
+
+    return x, float(f), np.array(path).reshape(-1, len(x)), evals[0], status
+
+def minimize(func, starts, bounds, args=(), values=None, radius=0.03,
+             abandon=0.1, batch=1, run=None):
+    """
+    Minimizes func(x, *args), which returns the value and gradient of a
+    non-positive acquisition function, e.g. minus EI, from the rows of
+    starts, batch of them per round, best first by their values if
+    given.  A start within radius of the path of a search that converged
+is skipped.
+    run(items), if given, runs a round of searches and returns
+    local_search(func, bounds, args, **item) for each item, e.g. in a
+    pool of processes; by default they run here, one after another.
+
+    Returns the points reached by the searches not stopped as
+    duplicates, best first, their values, and a dict of the number of
+    starts, duplicates, abandoned searches, rounds and evaluations.
+    """
+    starts = np.atleast_2d(np.asarray(starts, dtype=float))
+    if values is not None:
+        starts = starts[np.argsort(values, kind='mergesort')]
+
+    info   = { 'starts'      : starts.shape[0],
+               'duplicates'  : 0,
+               'abandoned'   : 0,
+               'rounds'      : 0,
+               'evaluations' : 0 }
+
+    if run is None:
+        def run(items):
+            return [local_search(func, bounds, args, **item)
+                    for item in items]
+
+    known  = np.zeros((0, starts.shape[1]))
+    best   = 0.0
+    points = []
+    fvals  = []
+    for first in xrange(0, starts.shape[0], batch):
+        items = []
+        for start in starts[first:first+batch]:
+            if (known.shape[0] > 0 and
+                np.min(np.sum((known - start)**2, axis=1)) < radius**2):
+                info['duplicates'] += 1
+            else:
+                items.append({ 'start'   : start,
+                               'known'   : known,
+                               'radius'  : radius,
+                               'best'    : best,
+                               'abandon' : abandon })
+        if len(items) == 0:
+            continue
+
+        info['rounds'] += 1
+        for x, f, path, evaluations, status in run(items):
+            info['evaluations'] += evaluations
+            if status == 'duplicate':
+                info['duplicates'] += 1
+                continue
+            # Only a search that converged marks out a basin; one given up
+            # on may have been crossing it on the way to somewhere better.
+            if status == 'abandoned':
+                info['abandoned'] += 1
+            else:
+                known = np.vstack((known, path, x))
+            best  = min(best, f)
+            points.append(x)
+            fvals.append(f)
+
+    points = np.array(points).reshape(-1, starts.shape[1])
+    fvals  = np.array(fvals)
+    order  = np.argsort(fvals, kind='mergesort')
+    return points[order], fvals[order], info
@@ -1,44 +1,438 @@
 import sys
 import os
+import time
 import traceback
+import multiprocessing
+import multiprocessing.pool
+import multiprocessing.queues
+import Queue
+import hashlib
+import sqlite3
+import select
+import resource
+import signal
+
+import numpy as np
 
 from spearmint.ExperimentGrid  import *
 from spearmint.helpers         import *
 
+try: import simplejson as json
+except ImportError: import json
+
 import logging
-import operator
+
+def run_python_job(objective_function, _id, parameters, working_directory):
+    """Run a Python function.  Returns its result, or None if it raised,
+    and how long it took."""
+    # Add experiment directory to the system path.
+    path = os.path.realpath(working_directory)
+    if path not in sys.path:
+        sys.path.append(path)
+
+    start_t = time.time()
+    try:
+        result = objective_function(_id, parameters)
+    except Exception:
+        logging.error("Job %d failed:\n%s", _id, traceback.format_exc())
+        result = None
+
+    return result, time.time() - start_t
+
+# Where the workers of a PoolRunner say which jobs they pick up
+pool_starts = None
+
+def init_pool_worker(starts):
+    global pool_starts
+    pool_starts = starts
+
+def run_pool_job(objective_function, _id, parameters, working_directory):
+    """Run a Python function in a worker of a PoolRunner, saying that
+    this worker has it first."""
+    pool_starts.put((_id, os.getpid()))
+    return run_python_job(objective_function, _id, parameters,
+                          working_directory)
+
+def run_worker(conn, memory_limit=None):
+    """Run the jobs sent over conn until it is closed, sending back their
+    results along with the CPU time and peak resident memory (in bytes)
+    of each."""
+    if memory_limit is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        reset_peak_rss()
+        start = cpu_time()
+        result, duration = run_python_job(*job)
+        usage = { 'cpu_time' : cpu_time() - start,
+                  'peak_rss' : peak_rss() }
+        conn.send((result, duration, usage))
+
+def cpu_time():
+    # Includes processes that the objective starts and waits for.
+    usage = [resource.getrusage(who) for who in (resource.RUSAGE_SELF,
+                                                 resource.RUSAGE_CHILDREN)]
+    return sum(u.ru_utime + u.ru_stime for u in usage)
+
+def reset_peak_rss():
+    # Linux lets a process reset its high water mark, so that it covers a
+    # single job rather than everything the worker has run so far.
+    try:
+        with open('/proc/self/clear_refs', 'w') as fh:
+            fh.write('5')
+    except IOError:
+        pass
+
+def peak_rss():
+    try:
+        with open('/proc/self/status') as fh:
+            for line in fh:
+                if line.startswith('VmHWM:'):
+                    return float(line.split()[1]) * 1024
+    except IOError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024.0
+
+EXPERIMENT_MEMO_FILE = 'expt-memo.db'
+
+# Shortest duration recorded for a job, in seconds
+MIN_DURATION = 1e-6
+
+class MemoCache(object):
+    """
+    Results of finished jobs, keyed by the cache key of their parameters.
+    They live in an SQLite database in the experiment directory, so that
+    a restarted experiment does not run the same configuration again.  At
+    most size results are kept, dropping the least recently used.
+    """
+
+    def __init__(self, working_directory, size=10000):
+        self.size    = size
+        self.db_file = os.path.join(working_directory, EXPERIMENT_MEMO_FILE)
+        self.db      = None
+
+    def get(self, key, default=None):
+        db  = self._connect()
+        row = db.execute('SELECT result FROM memo WHERE key = ?',
+                         (key,)).fetchone()
+        if row is None or row[0] is None:
+            return default
+
+        self.clock += 1
+        with db:
+            db.execute('UPDATE memo SET used = ? WHERE key = ?',
+                       (self.clock, key))
+        return row[0]
+
+    def __setitem__(self, key, result):
+        db = self._connect()
+        self.clock += 1
+        with db:
+            db.execute('INSERT OR REPLACE INTO memo (key, result, used) '
+                       'VALUES (?, ?, ?)', (key, float(result), self.clock))
+            db.execute('DELETE FROM memo WHERE used <= (SELECT used FROM memo '
+                       'ORDER BY used DESC LIMIT 1 OFFSET ?)', (self.size,))
+
+    def __len__(self):
+        return self._connect().execute('SELECT COUNT(*) FROM memo').fetchone()[0]
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def _connect(self):
+        # Connect on first use, so that worker processes started before
+        # then do not inherit the connection.
+        if self.db is not None:
+            return self.db
+
+        self.db = sqlite3.connect(self.db_file)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        with self.db:
+            self.db.execute('CREATE TABLE IF NOT EXISTS memo '
+                            '(key TEXT PRIMARY KEY, result REAL, used INTEGER)')
+            self.db.execute('CREATE INDEX IF NOT EXISTS memo_used '
+                            'ON memo (used)')
+
+        # Uses are numbered rather than timed, so that none of them tie.
+        self.clock = self.db.execute('SELECT MAX(used) FROM memo').fetchone()[0] or 0
+        return self.db
 
 # TODO: change this function to be more flexible when running python jobs
 # regarding the python path, experiment directory, etc...
 class PythonRunner():
-    
-    def __init__(self):
-        self.memoizer = {}
+    """Runs jobs one at a time, in this process.  Jobs are started with
+    submit() and their results picked up with collect()."""
+
+    def __init__(self, memoizer=None):
+        if memoizer is None:
+            memoizer = {}
+        self.memoizer = memoizer
+        self.finished = []
+        self.running  = 0
+        self.max_concurrent = 1
 
     def cache_key(self, params):
-        items = [ (k, tuple(v)) for k,v in params.items()]
-        items.sort(key=operator.itemgetter(0))
-        k = tuple(items)
-        return k
-        
-    def __call__(self, _id, objective_function, parameters, working_directory):
-        """Run a Python function."""
-        # Add experiment directory to the system path.
-        sys.path.append(os.path.realpath(working_directory))
+        # A hash of the parameters as JSON, which is the same from one run
+        # to the next.  Floats are written out in full by repr.
+        items = [ (k, np.asarray(v).tolist()) for k,v in params.items()]
+        items.sort()
+        return hashlib.sha1(json.dumps(items)).hexdigest()
 
+    def submit(self, _id, objective_function, parameters, working_directory):
+        """Start a job.  Returns True if the result was memoized, in
+        which case the job is not run at all."""
+        start_t = time.time()
         k = self.cache_key(parameters)
         result = self.memoizer.get(k, None)
-        usememoized = False
 
-        if result is None:
-            # Load up this module and run
-            result = objective_function(_id, parameters)
+        if result is not None:
+            # The job took as long as the lookup, which is never quite
+            # nothing, so that the durations stay positive for choosers
+            # that model their log.
+            logging.info("Memoized for %s: %s", parameters, result)
+            duration = max(time.time() - start_t, MIN_DURATION)
+            self.finished.append((_id, result, duration, {}))
+            return True
+
+        self.running += 1
+        self._start(_id, k, objective_function, parameters, working_directory)
+        return False
+
+    def collect(self, block=False):
+        """Returns (id, result, duration, usage) for the jobs that finished
+        since the last call.  If block is set and jobs are running, waits
+        for at least one to finish.  The result of a failed job is None,
+        and usage holds whatever resource accounting the runner keeps."""
+        finished, self.finished = self.finished, []
+        return finished
+
+    def close(self):
+        if hasattr(self.memoizer, 'close'):
+            self.memoizer.close()
+
+    def _start(self, _id, k, objective_function, parameters, working_directory):
+        result, duration = run_python_job(objective_function, _id, parameters,
+                                          working_directory)
+        self._finish(_id, k, result, duration)
+
+    def _finish(self, _id, k, result, duration, usage={}):
+        self.running -= 1
+        if result is not None:
             self.memoizer[k] = result
+            logging.info("Got result %f", result)
+        self.finished.append((_id, result, duration, usage))
+
+class PoolRunner(PythonRunner):
+    """Runs up to max_concurrent jobs at once in a pool of worker
+    processes.  A job that fails outside the objective, such as one whose
+    worker dies or whose result cannot be sent back, is reported as
+    broken.  A job running for longer than timeout seconds is reported as
+    broken too, and its worker killed."""
+
+    def __init__(self, max_concurrent, memoizer=None, timeout=None):
+        PythonRunner.__init__(self, memoizer)
+        self.max_concurrent = max_concurrent
+        self.timeout        = timeout
+        # The workers say which of them picked up each job, so that jobs
+        # on a worker that died are not waited for forever.
+        self.starts = multiprocessing.queues.SimpleQueue()
+        self.pool   = multiprocessing.Pool(max_concurrent, init_pool_worker,
+                                           (self.starts,))
+        self.tasks  = {}
+
+    def collect(self, block=False):
+        # Poll rather than block on the pool, so that the controller can
+        # still be interrupted and jobs that are lost get noticed.
+        while True:
+            self._poll()
+            if self.finished or not block or not self.tasks:
+                break
+            time.sleep(0.05)
+
+        return PythonRunner.collect(self)
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+        PythonRunner.close(self)
+
+    def _start(self, _id, k, objective_function, parameters, working_directory):
+        task = self.pool.apply_async(run_pool_job,
+                                     (objective_function, _id, parameters,
+                                      working_directory))
+        # The job's result, its memo key, when it was submitted and the
+        # worker and time it started on, once known.
+        self.tasks[_id] = [task, k, time.time(), None, None]
+
+    def _poll(self):
+        while not self.starts.empty():
+            _id, pid = self.starts.get()
+            if _id in self.tasks:
+                self.tasks[_id][3:] = [pid, time.time()]
+
+        now = time.time()
+        for _id, (task, k, submitted, pid, started) in self.tasks.items():
+            if task.ready():
+                del self.tasks[_id]
+                try:
+                    result, duration = task.get()
+                except Exception:
+                    logging.error("Job %d failed:\n%s", _id,
+                                  traceback.format_exc())
+                    result, duration = None, now - submitted
+                self._finish(_id, k, result, duration)
+
+            elif pid is not None and not self._alive(pid):
+                logging.error("Worker running job %d died", _id)
+                del self.tasks[_id]
+                self._finish(_id, k, None, now - started)
+
+            elif (started is not None and self.timeout is not None and
+                  now - started >= self.timeout):
+                logging.error("Job %d timed out after %.0f seconds", _id,
+                              now - started)
+                del self.tasks[_id]
+                self._kill(pid)
+                self._finish(_id, k, None, now - started)
+
+    def _alive(self, pid):
+        # The pool reaps and replaces a worker that died shortly after.
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return False
+        return True
+
+    def _kill(self, pid):
+        # The pool replaces the worker.
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+class ThreadRunner(PoolRunner):
+    """Runs jobs in threads of this process, so that the controller can
+    get on with choosing the next job while they run.  A thread cannot be
+    killed, so a job that times out is reported as broken but keeps its
+    thread until it returns."""
+
+    def __init__(self, max_concurrent=1, memoizer=None, timeout=None):
+        PythonRunner.__init__(self, memoizer)
+        self.max_concurrent = max_concurrent
+        self.timeout        = timeout
+        self.starts = Queue.Queue()
+        self.pool   = multiprocessing.pool.ThreadPool(max_concurrent,
+                                                      init_pool_worker,
+                                                      (self.starts,))
+        self.tasks  = {}
+
+    def _alive(self, pid):
+        return True
+
+    def _kill(self, pid):
+        pass
+
+class IsolatedRunner(PythonRunner):
+    """Runs jobs in max_concurrent worker processes that are reused from
+    job to job.  A job running for longer than timeout seconds is killed
+    and its worker replaced, and memory_limit caps the address space of
+    the workers, in bytes.  Reports the CPU time and peak resident memory
+    of each job."""
+
+    def __init__(self, max_concurrent=1, timeout=None, memory_limit=None,
+                 memoizer=None):
+        PythonRunner.__init__(self, memoizer)
+        self.max_concurrent = max_concurrent
+        self.timeout        = timeout
+        self.memory_limit   = memory_limit
+        self.idle = [self._spawn() for ii in xrange(max_concurrent)]
+        self.busy = {}
+
+    def collect(self, block=False):
+        while self.busy:
+            # Wait for a job to finish or for the oldest one to run out
+            # of time.
+            wait = 0.0
+            if block and not self.finished:
+                wait = None
+                if self.timeout is not None:
+                    started = min(job[3] for job in self.busy.values())
+                    wait = max(started + self.timeout - time.time(), 0.0)
+
+            for conn in select.select(self.busy.keys(), [], [], wait)[0]:
+                self._receive(conn)
+            self._kill_overdue()
+
+            if self.finished or not block:
+                break
+
+        return PythonRunner.collect(self)
+
+    def close(self):
+        # Let the idle workers exit; jobs still running are abandoned.
+        for process, conn in self.idle:
+            conn.send(None)
+            process.join()
+            conn.close()
+        for conn, job in self.busy.items():
+            job[0].terminate()
+            job[0].join()
+            conn.close()
+        PythonRunner.close(self)
+
+    def _start(self, _id, k, objective_function, parameters, working_directory):
+        process, conn = self.idle.pop()
+        conn.send((objective_function, _id, parameters, working_directory))
+        self.busy[conn] = (process, _id, k, time.time())
+
+    def _spawn(self):
+        conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=run_worker,
+                                          args=(child_conn, self.memory_limit))
+        process.daemon = True
+        process.start()
+        child_conn.close()
+        return process, conn
+
+    def _replace(self, process, conn):
+        process.terminate()
+        process.join()
+        conn.close()
+        self.idle.append(self._spawn())
+
+    def _receive(self, conn):
+        process, _id, k, started = self.busy.pop(conn)
+        try:
+            result, duration, usage = conn.recv()
+        except (EOFError, IOError):
+            # The worker died, e.g. killed by the OOM killer.
+            logging.error("Worker running job %d died", _id)
+            self._replace(process, conn)
+            self._finish(_id, k, None, time.time() - started)
+            return
 
-        else:
-            usememoized = True
-            logging.info("Memoized for %s: %s", k, result)
+        self.idle.append((process, conn))
+        self._finish(_id, k, result, duration, usage)
 
-        logging.info("Got result %f", result)
-        return result, usememoized
+    def _kill_overdue(self):
+        if self.timeout is None:
+            return
 
+        now = time.time()
+        for conn, (process, _id, k, started) in self.busy.items():
+            if now - started >= self.timeout:
+                logging.error("Job %d timed out after %.0f seconds", _id,
+                              now - started)
+                del self.busy[conn]
+                self._replace(process, conn)
+                self._finish(_id, k, None, now - started)
@@ -19,7 +19,13 @@
 # 
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import os
 import re
+import heapq
+import shutil
+import cPickle
+import tempfile
+import multiprocessing
 import numpy        as np
 import numpy.random as npr
 
@@ -31,63 +37,346 @@ def unpack_args(str):
     else:
         return {}
 
+def next_batch(chooser, k, grid, values, durations,
+               candidates, pending, complete):
+    '''
+    Picks k jobs by calling chooser.next k times, each time with the jobs
+    picked before as pending.  A pick is a candidate's index in the grid
+    or, for a new point, a (numcand, point) tuple, as chooser.next
+    returns them.  New points are added to the grid for the later picks
+    with its append() if it has one, as a streamed grid does, rather
+    than copying it; values and durations are only looked up for the
+    complete jobs, so they are left as they are.  Choosers that can
+    share work between the picks implement next_batch themselves.
+    '''
+    jobs = []
+    for i in xrange(k):
+        if candidates.shape[0] == 0 and len(jobs) > 0:
+            break
+
+        job = chooser.next(grid, values, durations,
+                           candidates, pending, complete)
+        jobs.append(job)
+
+        if isinstance(job, tuple):
+            index = grid.shape[0]
+            if hasattr(grid, 'append'):
+                grid = grid.append(job[1])
+            else:
+                grid = np.vstack((grid, job[1]))
+        else:
+            index      = job
+            candidates = candidates[candidates != job]
+        pending = np.append(pending, index).astype(int)
+
+    return jobs
+
+def top_candidates(score, grid, candidates, k=1, chunk_size=10000):
+    '''
+    Scores the candidates a chunk at a time, so that only chunk_size of
+    their points are held at once.  score(points) returns one value per
+    point, higher being better.  Returns the positions in candidates of
+    the k best, best first, along with their points and scores.  Ties go
+    to the earlier candidate.
+    '''
+    heap = []
+    for start in xrange(0, candidates.shape[0], chunk_size):
+        points = grid[candidates[start:start+chunk_size],:]
+        scores = np.asarray(score(points), dtype=float)
+        scores[np.isnan(scores)] = -np.inf
+
+        for ii in np.argsort(-scores, kind='mergesort')[:k]:
+            item = (scores[ii], -(start + ii), points[ii])
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, item)
+            else:
+                break
+
+    heap.sort(key=lambda item: item[:2], reverse=True)
+    return (np.array([-item[1] for item in heap], dtype=int),
+            np.array([item[2] for item in heap]).reshape(-1, grid.shape[1]),
+            np.array([item[0] for item in heap]))
+
+class SharedArrays:
+    '''
+    Registry of the large arrays met while pickling, which are saved to
+    files in the directory path and pickled as references to them.
+    Unpickling maps the files into memory, copy-on-write, so that the
+    processes that load them share one copy of the arrays, whatever
+    their size.
+    '''
+    def __init__(self, path, min_bytes=2**16):
+        self.path      = path
+        self.min_bytes = min_bytes
+        self.names     = {}
+
+    def persistent_id(self, obj):
+        if (not isinstance(obj, np.ndarray) or obj.dtype.hasobject or
+            obj.nbytes < self.min_bytes):
+            return None
+
+        # Hold on to the array, so that its id is not reused.
+        if id(obj) not in self.names:
+            name = '%d.npy' % len(self.names)
+            np.save(os.path.join(self.path, name), obj)
+            self.names[id(obj)] = (obj, name)
+        return self.names[id(obj)][1]
+
+    def persistent_load(self, name):
+        return np.load(os.path.join(self.path, name), mmap_mode='c')
+
+    def dump(self, obj, name):
+        fh      = open(os.path.join(self.path, name), 'wb')
+        pickler = cPickle.Pickler(fh, cPickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self.persistent_id
+        pickler.dump(obj)
+        fh.close()
+
+    def load(self, name):
+        fh        = open(os.path.join(self.path, name), 'rb')
+        unpickler = cPickle.Unpickler(fh)
+        unpickler.persistent_load = self.persistent_load
+        obj = unpickler.load()
+        fh.close()
+        return obj
+
+class WorkerPool:
+    '''
+    Worker processes, started on first use and kept, that work out
+    func(item, *shared) for many items and the same shared arguments.
+    The shared arguments, e.g. a model, are pickled once, with their
+    large arrays in SharedArrays, and each worker loads them at most
+    once, so that only func and the items are sent with the tasks.  They
+    are given to map, or to share for all the maps until unshare.  The
+    workers are not pickled along with the pool.
+    '''
+    def __init__(self, processes=None):
+        self.processes = processes or multiprocessing.cpu_count()
+        self.pool      = None
+        self.shares    = 0
+        self.token     = None
+
+    def __getstate__(self):
+        return { 'processes' : self.processes }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def share(self, *shared):
+        self.unshare()
+        self.shares += 1
+        path = tempfile.mkdtemp(prefix='spearmint-')
+        try:
+            SharedArrays(path).dump(shared, 'shared.pkl')
+        except:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+        self.token = (path, os.getpid(), self.shares)
+
+    def unshare(self):
+        # The workers' maps of the files outlive their removal.
+        if self.token is not None:
+            shutil.rmtree(self.token[0], ignore_errors=True)
+            self.token = None
+
+    def start(self):
+        '''
+        Start the workers now rather than on first use, e.g. before this
+        process has threads or open files that they should not inherit.
+        '''
+        if self.pool is None:
+            self.pool = multiprocessing.Pool(self.processes)
+
+    def map(self, func, items, *shared):
+        self.start()
+
+        if shared:
+            self.share(*shared)
+        try:
+            results = [self.pool.apply_async(_call_shared,
+                                             (self.token, func, item))
+                       for item in items]
+            return [res.get(1e8) for res in results]
+        finally:
+            if shared:
+                self.unshare()
+
+    def close(self):
+        self.unshare()
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+# The shared arguments last loaded, in a worker.
+_shared = (None, None)
+
+def _call_shared(token, func, item):
+    global _shared
+    if _shared[0] != token:
+        _shared = (None, None)
+        _shared = (token, SharedArrays(token[0]).load('shared.pkl'))
+
+    return func(item, *_shared[1])
+
 def slice_sample(init_x, logprob, sigma=1.0, step_out=True, max_steps_out=1000, 
-                 compwise=False, verbose=False):
-    def direction_slice(direction, init_x):
+                 compwise=False, verbose=False, logprobs=None, batch=1,
+                 stats=None):
+    '''
+    sigma is the step size, or one per dimension.  logprobs, if given,
+    takes an array of points, one per row, and returns their log
+    probabilities; the slices are then probed batch points at a time,
+    e.g. when several points cost about as much as one.  A record (the
+    direction, the steps out, the points rejected while shrinking, the
+    number of log probabilities evaluated) of every slice is appended to
+    stats.
+    '''
+    def direction_slice(direction, init_x, sigma, init_llh=None):
+        evaluations = [0]
+        def dir_logprobs(zs):
+            evaluations[0] += len(zs)
+            if logprobs is None:
+                return np.array([logprob(direction*z + init_x) for z in zs])
+            return np.asarray(logprobs(direction*np.reshape(zs, (-1,1)) +
+                                       init_x), dtype=float)
+
         def dir_logprob(z):
-            return logprob(direction*z + init_x)
-    
+            return dir_logprobs([z])[0]
+
+        # Moves the edge by step until it leaves the slice.
+        def step_edge(edge, step):
+            steps = 0
+            while steps <= max_steps_out:
+                zs     = edge + step*np.arange(steps, min(steps + batch,
+                                                          max_steps_out + 1))
+                inside = dir_logprobs(zs) > llh_s
+                if not np.all(inside):
+                    steps += np.argmin(inside)
+                    return edge + step*steps, steps
+                steps += len(zs)
+            return edge + step*max_steps_out, max_steps_out
+
+        if init_llh is None:
+            init_llh = dir_logprob(0.0)
+
         upper = sigma*npr.rand()
         lower = upper - sigma
-        llh_s = np.log(npr.rand()) + dir_logprob(0.0)
+        llh_s = np.log(npr.rand()) + init_llh
     
         l_steps_out = 0
         u_steps_out = 0
         if step_out:
-            while dir_logprob(lower) > llh_s and l_steps_out < max_steps_out:
-                l_steps_out += 1
-                lower       -= sigma
-            while dir_logprob(upper) > llh_s and u_steps_out < max_steps_out:
-                u_steps_out += 1
-                upper       += sigma
+            lower, l_steps_out = step_edge(lower, -sigma)
+            upper, u_steps_out = step_edge(upper, sigma)
             
+        # Points drawn in a batch that fall outside the interval shrunk by
+        # the ones before them are skipped, so that the accepted one is
+        # distributed as if they were drawn one at a time.
         steps_in = 0
         while True:
-            steps_in += 1
-            new_z     = (upper - lower)*npr.rand() + lower
-            new_llh   = dir_logprob(new_z)
-            if np.isnan(new_llh):
-                print new_z, direction*new_z + init_x, new_llh, llh_s, init_x, logprob(init_x)
-                raise Exception("Slice sampler got a NaN")
-            if new_llh > llh_s:
-                break
-            elif new_z < 0:
-                lower = new_z
-            elif new_z > 0:
-                upper = new_z
+            zs = (upper - lower)*npr.rand(batch) + lower
+            for new_z, new_llh in zip(zs, dir_logprobs(zs)):
+                if not lower <= new_z <= upper:
+                    continue
+                steps_in += 1
+                if np.isnan(new_llh):
+                    print new_z, direction*new_z + init_x, new_llh, llh_s, init_x, logprob(init_x)
+                    raise Exception("Slice sampler got a NaN")
+                if new_llh > llh_s:
+                    break
+                elif new_z < 0:
+                    lower = new_z
+                elif new_z > 0:
+                    upper = new_z
+                else:
+                    raise Exception("Slice sampler shrank to zero!")
             else:
-                raise Exception("Slice sampler shrank to zero!")
+                continue
+            break
 
         if verbose:
             print "Steps Out:", l_steps_out, u_steps_out, " Steps In:", steps_in
 
-        return new_z*direction + init_x
+        if stats is not None:
+            stats.append((direction, l_steps_out + u_steps_out, steps_in - 1,
+                          evaluations[0]))
+
+        return new_z*direction + init_x, new_llh
     
     if not init_x.shape:
         init_x = np.array([init_x])
 
-    dims = init_x.shape[0]
+    dims  = init_x.shape[0]
+    sigma = np.asarray(sigma, dtype=float)
     if compwise:
+        sigma    = sigma * np.ones(dims)
         ordering = range(dims)
         npr.shuffle(ordering)
-        cur_x = init_x.copy()
+        # Each slice starts where the last one ended, at a known log
+        # probability.
+        cur_x   = init_x.copy()
+        cur_llh = None
         for d in ordering:
             direction    = np.zeros((dims))
             direction[d] = 1.0
-            cur_x = direction_slice(direction, cur_x)
+            cur_x, cur_llh = direction_slice(direction, cur_x, sigma[d],
+                                             cur_llh)
         return cur_x
             
     else:
         direction = npr.randn(dims)
         direction = direction / np.sqrt(np.sum(direction**2))
-        return direction_slice(direction, init_x)
+        return direction_slice(direction, init_x,
+                               np.sqrt(np.sum((direction*sigma)**2))
+                               if sigma.ndim else float(sigma))[0]
+
+class SliceSampler:
+    '''
+    Slice samples one block of variables, carrying a step size for each
+    of them over from one sample to the next.  A step that is too short
+    has to be stepped out, and one that is too long has to be shrunk, so
+    the step sizes are adjusted until the two happen about as often.
+    Along a random direction, each variable takes its share of the
+    adjustment.  Each sample is drawn with fixed step sizes, and the
+    adjustments shrink with the number of moves made, so that the steps
+    settle and the samples still come from the target distribution.
+    The log probabilities evaluated are counted.
+    '''
+    def __init__(self, sigma=1.0, adapt=True, batch=1):
+        self.sigma       = sigma
+        self.adapt       = adapt
+        self.batch       = int(batch)
+        self.moves       = 1
+        self.samples     = 0
+        self.evaluations = 0
+
+    def sample(self, init_x, logprob, compwise=False, logprobs=None,
+               **kwargs):
+        # Blocks that change size, with the number of observations, start
+        # over from the average step.
+        if np.ndim(self.sigma) and np.size(self.sigma) != np.size(init_x):
+            self.sigma = np.mean(self.sigma)
+            self.moves = 1
+
+        stats = []
+        new_x = slice_sample(init_x, logprob, sigma=self.sigma,
+                             compwise=compwise, logprobs=logprobs,
+                             batch=self.batch, stats=stats, **kwargs)
+
+        self.samples     += 1
+        self.evaluations += sum(record[-1] for record in stats)
+        if self.adapt:
+            self.sigma = self.sigma * np.ones(np.size(new_x))
+            self.moves = self.moves * np.ones(np.size(new_x))
+            for direction, steps_out, rejected, _ in stats:
+                # At most a factor of e^2 at a time, when far off.
+                share       = direction**2
+                self.sigma *= np.exp(np.clip(steps_out - rejected, -2, 2) *
+                                     share / self.moves)
+                self.moves += share
+        return new_x
+
+    def evaluations_per_sample(self):
+        return self.evaluations / max(self.samples, 1.0)